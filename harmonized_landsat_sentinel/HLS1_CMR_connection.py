@@ -27,12 +27,14 @@ from .HLS2_landsat_granule import HLS2LandsatGranule
 from .HLS2_sentinel_granule import HLS2SentinelGranule
 from .HLS_CMR_query import HLS_CMR_query
 from .constants import *
+from .parse_date import parse_date
 from .daterange import date_range
 from .exceptions import *
 from .HLS2_CMR_login import HLS2_CMR_login
 from .HLS_connection import HLSConnection
 from .get_CMR_granule_ID import get_CMR_granule_ID
 from .timer import Timer
+from .write_COG import write_COG
 
 logger = logging.getLogger(__name__)
 
@@ -83,7 +85,7 @@ class HLS1CMRConnection(HLSConnection):
 
     def date_directory(self, date_UTC: Union[date, str]) -> str:
         if isinstance(date_UTC, str):
-            date_UTC = parser.parse(date_UTC).date()
+            date_UTC = parse_date(date_UTC)
 
         directory = join(self.download_directory, f"{date_UTC:%Y.%m.%d}")
 
@@ -106,7 +108,7 @@ class HLS1CMRConnection(HLSConnection):
 
     def sentinel(self, tile: str, date_UTC: Union[date, str]) -> HLS2SentinelGranule:
         if isinstance(date_UTC, str):
-            date_UTC = parser.parse(date_UTC).date()
+            date_UTC = parse_date(date_UTC)
 
         logger.info(f"searching for Sentinel tile {cl.name(tile)} on {cl.time(date_UTC)}")
         granule: earthaccess.search.DataGranule
@@ -126,7 +128,7 @@ class HLS1CMRConnection(HLSConnection):
 
     def landsat(self, tile: str, date_UTC: Union[date, str]) -> HLS2LandsatGranule:
         if isinstance(date_UTC, str):
-            date_UTC = parser.parse(date_UTC).date()
+            date_UTC = parse_date(date_UTC)
 
         logger.info(f"searching for Landsat tile {cl.name(tile)} on {cl.time(date_UTC)}")
         granule: earthaccess.search.DataGranule
@@ -210,7 +212,7 @@ class HLS1CMRConnection(HLSConnection):
 
         if (save_data or return_filename) and not exists(product_filename):
             self.logger.info(f"saving HLS2 NDVI: {cl.file(product_filename)}")
-            NDVI.to_COG(product_filename)
+            write_COG(NDVI, product_filename)
 
             if save_preview:
                 self.logger.info(f"saving HLS2 NDVI preview: {cl.file(preview_filename)}")
@@ -225,13 +227,13 @@ class HLS1CMRConnection(HLSConnection):
 
     def product_directory(self, product: str, date_UTC: Union[date, str]):
         if isinstance(date_UTC, str):
-            date_UTC = parser.parse(date_UTC).date()
+            date_UTC = parse_date(date_UTC)
 
         return join(self.products_directory, product, f"{date_UTC:%Y.%m.%d}")
 
     def product_filename(self, product: str, date_UTC: Union[date, str], tile: str):
         if isinstance(date_UTC, str):
-            date_UTC = parser.parse(date_UTC).date()
+            date_UTC = parse_date(date_UTC)
 
         directory = self.product_directory(product=product, date_UTC=date_UTC)
         filename = join(directory, f"HLS_{tile}_{date_UTC:%Y%m%d}_{product}.tif")
@@ -307,7 +309,7 @@ class HLS1CMRConnection(HLSConnection):
 
         if (save_data and return_filename) and not exists(product_filename):
             self.logger.info(f"saving HLS2 albedo: {cl.file(product_filename)}")
-            albedo.to_COG(product_filename)
+            write_COG(albedo, product_filename)
 
             if save_preview:
                 self.logger.info(f"saving HLS2 albedo preview: {cl.file(preview_filename)}")
@@ -389,7 +391,7 @@ class HLS1CMRConnection(HLSConnection):
         return granules
 
     def dates_listed(self, tile: str) -> Set[date]:
-        return set(self._listing[self._listing.tile == tile].date_UTC.apply(lambda date_UTC: parser.parse(date_UTC).date()))
+        return set(self._listing[self._listing.tile == tile].date_UTC.apply(lambda date_UTC: parse_date(date_UTC)))
 
     def listing(
             self,
@@ -406,17 +408,17 @@ class HLS1CMRConnection(HLSConnection):
         timer = Timer()
 
         if isinstance(start_UTC, str):
-            start_UTC = parser.parse(start_UTC).date()
+            start_UTC = parse_date(start_UTC)
 
         if end_UTC is None:
             end_UTC = start_UTC
 
         if isinstance(end_UTC, str):
-            end_UTC = parser.parse(end_UTC).date()
+            end_UTC = parse_date(end_UTC)
 
         if set(date_range(start_UTC, end_UTC)) <= self.dates_listed(tile):
             listing_subset = self._listing[self._listing.tile == tile]
-            listing_subset = listing_subset[listing_subset.date_UTC.apply(lambda date_UTC: parser.parse(str(date_UTC)).date() >= start_UTC and parser.parse(str(date_UTC)).date() <= end_UTC)]
+            listing_subset = listing_subset[listing_subset.date_UTC.apply(lambda date_UTC: parse_date(str(date_UTC)) >= start_UTC and parse_date(str(date_UTC)) <= end_UTC)]
             listing_subset = listing_subset.sort_values(by="date_UTC")
 
             return listing_subset
@@ -464,7 +466,7 @@ class HLS1CMRConnection(HLSConnection):
             if d in sentinel_dates:
                 sentinel_dates_expected.add(d)
 
-            if (parser.parse(d).date() - timedelta(days=SENTINEL_REPEAT_DAYS)).strftime(
+            if (parse_date(d) - timedelta(days=SENTINEL_REPEAT_DAYS)).strftime(
                     "%Y-%m-%d") in sentinel_dates_expected:
                 sentinel_dates_expected.add(d)
 
@@ -487,12 +489,12 @@ class HLS1CMRConnection(HLSConnection):
             if d in landsat_dates:
                 landsat_dates_expected.add(d)
 
-            if (parser.parse(d).date() - timedelta(days=LANDSAT_REPEAT_DAYS)).strftime(
+            if (parse_date(d) - timedelta(days=LANDSAT_REPEAT_DAYS)).strftime(
                     "%Y-%m-%d") in landsat_dates_expected:
                 landsat_dates_expected.add(d)
 
-        # listing["landsat_expected"] = listing.apply(lambda row: parser.parse(str(row.date_UTC)).date().strftime("%Y-%m-%d") in landsat_dates_expected, axis=1)
-        listing["landsat_expected"] = listing.date_UTC.apply(lambda date_UTC: parser.parse(str(date_UTC)).date().strftime("%Y-%m-%d") in landsat_dates_expected)
+        # listing["landsat_expected"] = listing.apply(lambda row: parse_date(str(row.date_UTC)).strftime("%Y-%m-%d") in landsat_dates_expected, axis=1)
+        listing["landsat_expected"] = listing.date_UTC.apply(lambda date_UTC: parse_date(str(date_UTC)).strftime("%Y-%m-%d") in landsat_dates_expected)
 
         listing["landsat_missing"] = listing.apply(
             lambda row: not row.landsat_available and row.landsat_expected and parser.parse(
@@ -512,7 +514,7 @@ class HLS1CMRConnection(HLSConnection):
 
     def sentinel_granule(self, tile: str, date_UTC: Union[date, str]) -> earthaccess.search.DataGranule:
         if isinstance(date_UTC, str):
-            date_UTC = parser.parse(date_UTC).date()
+            date_UTC = parse_date(date_UTC)
 
         listing = self.listing(tile=tile, start_UTC=date_UTC, end_UTC=date_UTC)
         granule = listing.iloc[-1].sentinel
@@ -528,7 +530,7 @@ class HLS1CMRConnection(HLSConnection):
 
     def landsat_granule(self, tile: str, date_UTC: Union[date, str]) -> earthaccess.search.DataGranule:
         if isinstance(date_UTC, str):
-            date_UTC = parser.parse(date_UTC).date()
+            date_UTC = parse_date(date_UTC)
 
         listing = self.listing(tile=tile, start_UTC=date_UTC, end_UTC=date_UTC)
         granule = listing.iloc[-1].landsat
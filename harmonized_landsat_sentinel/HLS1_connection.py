@@ -7,7 +7,6 @@ from os.path import exists, getsize, dirname, join
 import posixpath
 import logging
 from datetime import date, datetime, timedelta
-from dateutil import parser
 
 import numpy as np
 import pandas as pd
@@ -17,8 +16,10 @@ from rasters import Raster
 import colored_logging as cl
 
 from .constants import *
+from .parse_date import parse_date
 from .exceptions import *
 from .timer import Timer
+from .write_COG import write_COG
 from .daterange import date_range
 from .HLS1_landsat_granule import HLS1LandsatGranule
 from .HLS1_sentinel_granule import HLS1SentinelGranule
@@ -116,13 +117,13 @@ class HLS1Connection(HLSConnection):
             f"started listing available HLS2 granules at tile {cl.place(tile)} from {cl.time(start_UTC)} to {cl.time(end_UTC)}")
 
         if isinstance(start_UTC, str):
-            start_UTC = parser.parse(start_UTC).date()
+            start_UTC = parse_date(start_UTC)
 
         if end_UTC is None:
             end_UTC = start_UTC
 
         if isinstance(end_UTC, str):
-            end_UTC = parser.parse(end_UTC).date()
+            end_UTC = parse_date(end_UTC)
 
         giveup_date = datetime.utcnow().date() - timedelta(days=GIVEUP_DAYS)
         search_start = start_UTC - timedelta(days=max(SENTINEL_REPEAT_DAYS, LANDSAT_REPEAT_DAYS))
@@ -151,15 +152,15 @@ class HLS1Connection(HLSConnection):
 
         listing = listing[listing.date_UTC >= str(start_UTC)]
         listing.date_UTC = listing.date_UTC.apply(
-            lambda date_UTC: parser.parse(str(date_UTC)).date().strftime("%Y-%m-%d"))
+            lambda date_UTC: parse_date(str(date_UTC)).strftime("%Y-%m-%d"))
         dates = pd.DataFrame(
             {"date_UTC": [date_UTC.strftime("%Y-%m-%d") for date_UTC in date_range(start_UTC, end_UTC)], "tile": tile})
         listing = pd.merge(dates, listing, how="left")
-        listing.date_UTC = listing.date_UTC.apply(lambda date_UTC: parser.parse(date_UTC).date())
+        listing.date_UTC = listing.date_UTC.apply(lambda date_UTC: parse_date(date_UTC))
         listing = listing.sort_values(by="date_UTC")
         listing["sentinel_available"] = listing.apply(lambda row: not pd.isna(row.sentinel), axis=1)
         listing["sentinel_expected"] = listing.apply(
-            lambda row: parser.parse(str(row.date_UTC)).date() in sentinel_dates, axis=1)
+            lambda row: parse_date(str(row.date_UTC)) in sentinel_dates, axis=1)
 
         listing["sentinel_missing"] = listing.apply(
             lambda row: not row.sentinel_available and row.sentinel_expected and row.date_UTC >= giveup_date,
@@ -168,7 +169,7 @@ class HLS1Connection(HLSConnection):
 
         listing["sentinel"] = listing.apply(lambda row: "missing" if row.sentinel_missing else row.sentinel, axis=1)
         listing["landsat_available"] = listing.apply(lambda row: not pd.isna(row.landsat), axis=1)
-        listing["landsat_expected"] = listing.apply(lambda row: parser.parse(str(row.date_UTC)).date() in landsat_dates,
+        listing["landsat_expected"] = listing.apply(lambda row: parse_date(str(row.date_UTC)) in landsat_dates,
                                                     axis=1)
 
         listing["landsat_missing"] = listing.apply(
@@ -185,7 +186,7 @@ class HLS1Connection(HLSConnection):
 
     def sentinel_filename(self, tile: str, date_UTC: Union[date, str]):
         if isinstance(date_UTC, str):
-            date_UTC = parser.parse(date_UTC).date()
+            date_UTC = parse_date(date_UTC)
 
         listing = self.listing(tile=tile, start_UTC=(date_UTC - timedelta(days=5)), end_UTC=date_UTC)
         filename = str(listing.iloc[-1].sentinel)
@@ -203,7 +204,7 @@ class HLS1Connection(HLSConnection):
 
     def sentinel_URL(self, tile: str, date_UTC: Union[date, str]):
         if isinstance(date_UTC, str):
-            date_UTC = parser.parse(date_UTC).date()
+            date_UTC = parse_date(date_UTC)
 
         directory = self.sentinel_directory(tile=tile, year=date_UTC.year)
         filename = self.sentinel_filename(tile=tile, date_UTC=date_UTC)
@@ -213,7 +214,7 @@ class HLS1Connection(HLSConnection):
 
     def landsat_filename(self, tile: str, date_UTC: Union[date, str]):
         if isinstance(date_UTC, str):
-            date_UTC = parser.parse(date_UTC).date()
+            date_UTC = parse_date(date_UTC)
 
         filename = str(self.listing(tile=tile, start_UTC=date_UTC, end_UTC=date_UTC).iloc[0].landsat)
 
@@ -228,7 +229,7 @@ class HLS1Connection(HLSConnection):
 
     def landsat_URL(self, tile: str, date_UTC: Union[date, str]):
         if isinstance(date_UTC, str):
-            date_UTC = parser.parse(date_UTC).date()
+            date_UTC = parse_date(date_UTC)
 
         directory = self.landsat_directory(tile=tile, year=date_UTC.year)
         filename = self.landsat_filename(tile=tile, date_UTC=date_UTC)
@@ -270,7 +271,7 @@ class HLS1Connection(HLSConnection):
 
     def local_directory(self, date_UTC: Union[date, str]) -> str:
         if isinstance(date_UTC, str):
-            date_UTC = parser.parse(date_UTC).date()
+            date_UTC = parse_date(date_UTC)
 
         directory = join(self.download_directory, f"{date_UTC:%Y.%m.%d}")
 
@@ -278,7 +279,7 @@ class HLS1Connection(HLSConnection):
 
     def local_sentinel_filename(self, tile: str, date_UTC: Union[date, str]) -> str:
         if isinstance(date_UTC, str):
-            date_UTC = parser.parse(date_UTC).date()
+            date_UTC = parse_date(date_UTC)
 
         if self.check_unavailable_date("Sentinel", tile, date_UTC):
             raise HLSSentinelNotAvailable(f"Sentinel is not available at tile {cl.place(tile)} on {cl.time(date_UTC)}")
@@ -299,7 +300,7 @@ class HLS1Connection(HLSConnection):
 
     def local_landsat_filename(self, tile: str, date_UTC: Union[date, str]) -> str:
         if isinstance(date_UTC, str):
-            date_UTC = parser.parse(date_UTC).date()
+            date_UTC = parse_date(date_UTC)
 
         if self.check_unavailable_date("Landsat", tile, date_UTC):
             raise HLSLandsatNotAvailable(f"Landsat is not available at tile {cl.place(tile)} on {cl.time(date_UTC)}")
@@ -319,7 +320,7 @@ class HLS1Connection(HLSConnection):
 
     def sentinel(self, tile: str, date_UTC: Union[date, str]) -> HLS1SentinelGranule:
         if isinstance(date_UTC, str):
-            date_UTC = parser.parse(date_UTC).date()
+            date_UTC = parse_date(date_UTC)
 
         logger.info(f"searching for Sentinel tile {cl.name(tile)} on {cl.time(date_UTC)}")
         filename = self.local_sentinel_filename(tile=tile, date_UTC=date_UTC)
@@ -337,7 +338,7 @@ class HLS1Connection(HLSConnection):
 
     def landsat(self, tile: str, date_UTC: Union[date, str]) -> HLS1LandsatGranule:
         if isinstance(date_UTC, str):
-            date_UTC = parser.parse(date_UTC).date()
+            date_UTC = parse_date(date_UTC)
 
         logger.info(f"searching for Landsat tile {cl.name(tile)} on {cl.time(date_UTC)}")
         filename = self.local_landsat_filename(tile=tile, date_UTC=date_UTC)
@@ -414,7 +415,7 @@ class HLS1Connection(HLSConnection):
 
         if (save_data or return_filename) and not exists(product_filename):
             self.logger.info(f"saving HLS2 NDVI: {cl.file(product_filename)}")
-            NDVI.to_COG(product_filename)
+            write_COG(NDVI, product_filename)
 
             if save_preview:
                 self.logger.info(f"saving HLS2 NDVI preview: {cl.file(preview_filename)}")
@@ -429,13 +430,13 @@ class HLS1Connection(HLSConnection):
 
     def product_directory(self, product: str, date_UTC: Union[date, str]):
         if isinstance(date_UTC, str):
-            date_UTC = parser.parse(date_UTC).date()
+            date_UTC = parse_date(date_UTC)
 
         return join(self.products_directory, product, f"{date_UTC:%Y.%m.%d}")
 
     def product_filename(self, product: str, date_UTC: Union[date, str], tile: str):
         if isinstance(date_UTC, str):
-            date_UTC = parser.parse(date_UTC).date()
+            date_UTC = parse_date(date_UTC)
 
         directory = self.product_directory(product=product, date_UTC=date_UTC)
         filename = join(directory, f"HLS_{tile}_{date_UTC:%Y%m%d}_{product}.tif")
@@ -504,7 +505,7 @@ class HLS1Connection(HLSConnection):
 
         if (save_data or return_filename) and not exists(product_filename):
             self.logger.info(f"saving HLS2 albedo: {cl.file(product_filename)}")
-            albedo.to_COG(product_filename)
+            write_COG(albedo, product_filename)
 
             if save_preview:
                 self.logger.info(f"saving HLS2 albedo preview: {cl.file(preview_filename)}")
@@ -57,11 +57,11 @@ class HLS1Granule(HLSGranule):
         image = self.DN(band)
 
         if apply_scale:
-            image = rt.where(image == -1000, np.nan, image * 0.0001)
-            image = rt.where(image < 0, np.nan, image)
+            image = rt.where(image == -1000, np.float32(np.nan), image * np.float32(0.0001))
+            image = rt.where(image < 0, np.float32(np.nan), image)
 
         if apply_cloud:
-            image = rt.where(self.cloud, np.nan, image)
+            image = rt.where(self.cloud, np.float32(np.nan), image)
 
         return image
 
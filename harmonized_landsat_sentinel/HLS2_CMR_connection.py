@@ -1,14 +1,24 @@
-from typing import Union, List, Set
-
-from time import sleep
+from typing import Union, List, Set, Tuple, Optional
+
+import json
+import os
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from time import sleep, time as unix_time
 from traceback import format_exception
-from os.path import abspath, expanduser, join, exists
+from os import makedirs
+from os.path import abspath, expanduser, join, exists, getsize, basename
 import logging
 from datetime import date, datetime, time, timedelta
 from dateutil import parser
 
 import pandas as pd
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
 import earthaccess
 
 import colored_logging as cl
@@ -19,6 +29,7 @@ import rasters as rt
 from rasters import Raster
 
 from .constants import *
+from .parse_date import parse_date
 from .exceptions import *
 from .HLS2_CMR_login import HLS2_CMR_login
 from .HLS_connection import HLSConnection
@@ -27,7 +38,10 @@ from .HLS2_sentinel_granule import HLS2SentinelGranule
 from .HLS2_landsat_granule import HLS2LandsatGranule
 from .HLS_CMR_query import HLS_CMR_query
 from .timer import Timer
+from .write_COG import write_COG
 from .daterange import date_range
+from .nanmean_pair import nanmean_pair
+from .repeat_pass_mask import repeat_pass_mask
 
 logger = logging.getLogger(__name__)
 
@@ -41,7 +55,8 @@ class HLS2CMRConnection(HLSConnection):
             products_directory: str = None,
             target_resolution: int = None,
             retries: int = DEFAULT_RETRIES,
-            wait_seconds: float = DEFAULT_WAIT_SECONDS):
+            wait_seconds: float = DEFAULT_WAIT_SECONDS,
+            download_threads: int = DEFAULT_DOWNLOAD_THREADS):
         if target_resolution is None:
             target_resolution = self.DEFAULT_TARGET_RESOLUTION
 
@@ -72,13 +87,40 @@ class HLS2CMRConnection(HLSConnection):
 
         self.retries = retries
         self.wait_seconds = wait_seconds
-
-        self._listing = pd.DataFrame([], columns=["date_UTC", "tile", "sentinel", "landsat"])
-        self._granules = pd.DataFrame([], columns=["ID", "sensor", "tile", "date_UTC", "granule"])
+        self.download_threads = download_threads
+        self._session = self._build_session()
+        self._CMR_session = self._build_CMR_session()
+        self._listing_cache_directory = join(self.products_directory, LISTING_CACHE_DIRECTORY)
+
+        # results are buffered as chunks and only concatenated when read back
+        self._listing_chunks = [pd.DataFrame([], columns=["date_UTC", "tile", "sentinel", "landsat"])]
+        self._granules_chunks = [pd.DataFrame([], columns=["ID", "sensor", "tile", "date_UTC", "granule"])]
+        self._listed_dates = defaultdict(set)
+        # listing results keyed by (tile, start, end), cleared whenever a new listing is recorded
+        self._listing_windows = {}
+        self._granule_IDs = set()
+        # guards the shared chunk buffers when several tiles are listed concurrently
+        self._lock = threading.Lock()
+
+    @property
+    def _listing(self) -> pd.DataFrame:
+        with self._lock:
+            if len(self._listing_chunks) > 1:
+                self._listing_chunks = [pd.concat(self._listing_chunks).drop_duplicates(subset=["date_UTC", "tile"])]
+
+            return self._listing_chunks[0]
+
+    @property
+    def _granules(self) -> pd.DataFrame:
+        with self._lock:
+            if len(self._granules_chunks) > 1:
+                self._granules_chunks = [pd.concat(self._granules_chunks).drop_duplicates(subset=["ID", "date_UTC"])]
+
+            return self._granules_chunks[0]
 
     def date_directory(self, date_UTC: Union[date, str]) -> str:
         if isinstance(date_UTC, str):
-            date_UTC = parser.parse(date_UTC).date()
+            date_UTC = parse_date(date_UTC)
 
         directory = join(self.download_directory, f"{date_UTC:%Y.%m.%d}")
 
@@ -99,21 +141,117 @@ class HLS2CMRConnection(HLSConnection):
 
         return granule_directory
 
+    def _retry(self) -> Retry:
+        return Retry(
+            total=self.retries,
+            backoff_factor=2,
+            status_forcelist=RETRY_STATUS_CODES,
+            respect_retry_after_header=True
+        )
+
+    def _build_session(self) -> requests.Session:
+        # one authenticated session per connection so granule files share pooled keep-alive connections
+        session = earthaccess.get_requests_https_session()
+
+        adapter = HTTPAdapter(
+            pool_connections=self.download_threads,
+            pool_maxsize=self.download_threads,
+            max_retries=self._retry()
+        )
+
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+        return session
+
+    def _build_CMR_session(self) -> requests.Session:
+        # searches are kept off the download pool and reuse their own keep-alive connections to CMR
+        session = requests.Session()
+
+        # the Landsat and Sentinel collections are paged concurrently for each of the tiles listed at once
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=2 * DEFAULT_PROCESS_THREADS,
+            max_retries=self._retry()
+        )
+
+        session.mount("https://", adapter)
+
+        return session
+
+    def _download_one(self, URL: str, directory: str) -> str:
+        filename = join(directory, basename(URL))
+
+        if exists(filename) and getsize(filename) == 0:
+            logger.warning(f"removing zero-size corrupted HLS2 file: {filename}")
+            os.remove(filename)
+
+        if exists(filename):
+            logger.info(f"file already downloaded: {cl.file(filename)}")
+            return filename
+
+        makedirs(directory, exist_ok=True)
+        partial_filename = f"{filename}.download"
+        timer = Timer()
+
+        try:
+            with self._session.get(URL, stream=True) as response:
+                response.raise_for_status()
+
+                with open(partial_filename, "wb") as file:
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        file.write(chunk)
+
+            os.replace(partial_filename, filename)
+        finally:
+            # a stream that fails partway must not leave a partial file in the granule directory
+            if exists(partial_filename):
+                os.remove(partial_filename)
+
+        logger.info(f"completed download in {cl.time(timer)} seconds: {cl.file(filename)}")
+
+        return filename
+
+    def download_granule(self, granule: earthaccess.search.DataGranule, directory: str) -> List[str]:
+        URLs = granule.data_links()
+        filenames = [join(directory, basename(URL)) for URL in URLs]
+        pending_URLs = [
+            URL
+            for URL, filename
+            in zip(URLs, filenames)
+            if not (exists(filename) and getsize(filename) > 0)
+        ]
+
+        # files already on disk are reported in one line rather than one line each
+        if len(pending_URLs) < len(URLs):
+            logger.info(
+                f"{cl.val(len(URLs) - len(pending_URLs))} of {cl.val(len(URLs))} files already downloaded: {cl.file(directory)}")
+
+        if len(pending_URLs) == 0:
+            return filenames
+
+        with ThreadPoolExecutor(max_workers=min(self.download_threads, len(pending_URLs))) as executor:
+            futures = [executor.submit(self._download_one, URL, directory) for URL in pending_URLs]
+
+        for future in futures:
+            try:
+                future.result()
+            except Exception as e:
+                raise HLSDownloadFailed("Error when downloading HLS2 files") from e
+
+        return filenames
+
     def sentinel(self, tile: str, date_UTC: Union[date, str]) -> HLS2SentinelGranule:
         if isinstance(date_UTC, str):
-            date_UTC = parser.parse(date_UTC).date()
+            date_UTC = parse_date(date_UTC)
 
         logger.info(f"searching for Sentinel tile {cl.name(tile)} on {cl.time(date_UTC)}")
         granule: earthaccess.search.DataGranule
         granule = self.sentinel_granule(tile=tile, date_UTC=date_UTC)
         directory = self.sentinel_directory(granule, date_UTC=date_UTC)
 
-        # TODO: login dude
         logger.info(f"retrieving Sentinel tile {cl.name(tile)} on {cl.time(date_UTC)}: {directory}")
-        file_paths = earthaccess.download(granule, directory)
-        for download_file_path in file_paths:
-            if isinstance(download_file_path, Exception):
-                raise HLSDownloadFailed("Error when downloading HLS2 files") from download_file_path
+        self.download_granule(granule, directory)
 
         hls_granule = HLS2SentinelGranule(directory)
 
@@ -121,7 +259,7 @@ class HLS2CMRConnection(HLSConnection):
 
     def landsat(self, tile: str, date_UTC: Union[date, str]) -> HLS2LandsatGranule:
         if isinstance(date_UTC, str):
-            date_UTC = parser.parse(date_UTC).date()
+            date_UTC = parse_date(date_UTC)
 
         logger.info(f"searching for Landsat tile {cl.name(tile)} on {cl.time(date_UTC)}")
         granule: earthaccess.search.DataGranule
@@ -129,15 +267,45 @@ class HLS2CMRConnection(HLSConnection):
         directory = self.landsat_directory(granule, tile=tile, date_UTC=date_UTC)
 
         logger.info(f"retrieving Landsat tile {cl.name(tile)} on {cl.time(date_UTC)}: {directory}")
-        file_paths = earthaccess.download(granule, directory)
-        for download_file_path in file_paths:
-            if isinstance(download_file_path, Exception):
-                raise HLSDownloadFailed("Error when downloading HLS2 files") from download_file_path
+        self.download_granule(granule, directory)
 
         hls_granule = HLS2LandsatGranule(directory)
 
         return hls_granule
 
+    def sentinel_and_landsat(
+            self,
+            tile: str,
+            date_UTC: Union[date, str]) -> Tuple[Optional[HLS2SentinelGranule], Optional[HLS2LandsatGranule]]:
+        if isinstance(date_UTC, str):
+            date_UTC = parse_date(date_UTC)
+
+        # list the date once up front so the two concurrent fetches share a single CMR search
+        self.listing(tile=tile, start_UTC=date_UTC, end_UTC=date_UTC)
+
+        # resolve both granules from the listing before downloading anything,
+        # so a missing granule fails the request without fetching the other sensor
+        try:
+            self.sentinel_granule(tile=tile, date_UTC=date_UTC)
+            sentinel_available = True
+        except HLSSentinelNotAvailable:
+            sentinel_available = False
+
+        try:
+            self.landsat_granule(tile=tile, date_UTC=date_UTC)
+            landsat_available = True
+        except HLSLandsatNotAvailable:
+            landsat_available = False
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            sentinel_future = executor.submit(self.sentinel, tile=tile, date_UTC=date_UTC) if sentinel_available else None
+            landsat_future = executor.submit(self.landsat, tile=tile, date_UTC=date_UTC) if landsat_available else None
+
+            sentinel = sentinel_future.result() if sentinel_future is not None else None
+            landsat = landsat_future.result() if landsat_future is not None else None
+
+        return sentinel, landsat
+
     def NDVI(
             self,
             tile: str,
@@ -147,6 +315,9 @@ class HLS2CMRConnection(HLSConnection):
             save_data: bool = False,
             save_preview: bool = False,
             return_filename: bool = False) -> Union[Raster, str]:
+        if isinstance(date_UTC, str):
+            date_UTC = parse_date(date_UTC)
+
         target_tile = tile
         target_geometry = self.grid(target_tile)
         tile = tile[:5]
@@ -169,19 +340,7 @@ class HLS2CMRConnection(HLSConnection):
                 self.logger.info(f"loading HLS2 NDVI: {cl.file(product_filename)}")
                 return Raster.open(product_filename, geometry=target_geometry)
 
-        try:
-            sentinel = self.sentinel(tile=tile, date_UTC=date_UTC)
-        except HLSSentinelNotAvailable:
-            sentinel = None
-        except HLSSentinelMissing as e:
-            raise e
-
-        try:
-            landsat = self.landsat(tile=tile, date_UTC=date_UTC)
-        except HLSLandsatNotAvailable:
-            landsat = None
-        except HLSLandsatMissing as e:
-            raise e
+        sentinel, landsat = self.sentinel_and_landsat(tile=tile, date_UTC=date_UTC)
 
         if sentinel is None and landsat is None:
             raise HLSNotAvailable(f"HLS2 is not available at {tile} on {date_UTC}")
@@ -196,7 +355,7 @@ class HLS2CMRConnection(HLSConnection):
             except HLSBandNotAcquired:
                 raise HLSNotAvailable(f"HLS2 L30 is not available at {tile} on {date_UTC}")
         else:
-            NDVI = rt.Raster(np.nanmean(np.dstack([sentinel.NDVI, landsat.NDVI]), axis=2), geometry=sentinel.geometry)
+            NDVI = rt.Raster(nanmean_pair(sentinel.NDVI, landsat.NDVI), geometry=sentinel.geometry)
 
         if self.target_resolution > 30:
             NDVI = NDVI.to_geometry(geometry, resampling="average")
@@ -205,7 +364,7 @@ class HLS2CMRConnection(HLSConnection):
 
         if (save_data or return_filename) and not exists(product_filename):
             self.logger.info(f"saving HLS2 NDVI: {cl.file(product_filename)}")
-            NDVI.to_COG(product_filename)
+            write_COG(NDVI, product_filename)
 
             if save_preview:
                 self.logger.info(f"saving HLS2 NDVI preview: {cl.file(preview_filename)}")
@@ -220,13 +379,13 @@ class HLS2CMRConnection(HLSConnection):
 
     def product_directory(self, product: str, date_UTC: Union[date, str]):
         if isinstance(date_UTC, str):
-            date_UTC = parser.parse(date_UTC).date()
+            date_UTC = parse_date(date_UTC)
 
         return join(self.products_directory, product, f"{date_UTC:%Y.%m.%d}")
 
     def product_filename(self, product: str, date_UTC: Union[date, str], tile: str):
         if isinstance(date_UTC, str):
-            date_UTC = parser.parse(date_UTC).date()
+            date_UTC = parse_date(date_UTC)
 
         directory = self.product_directory(product=product, date_UTC=date_UTC)
         filename = join(directory, f"HLS_{tile}_{date_UTC:%Y%m%d}_{product}.tif")
@@ -243,6 +402,9 @@ class HLS2CMRConnection(HLSConnection):
             save_preview: bool = False,
             return_filename: bool = False) -> Union[Raster, str]:
 
+        if isinstance(date_UTC, str):
+            date_UTC = parse_date(date_UTC)
+
         target_tile = tile
         target_geometry = self.grid(target_tile)
         tile = tile[:5]
@@ -265,19 +427,7 @@ class HLS2CMRConnection(HLSConnection):
                 self.logger.info(f"loading HLS2 albedo: {cl.file(product_filename)}")
                 return Raster.open(product_filename, geometry=target_geometry)
 
-        try:
-            sentinel = self.sentinel(tile=tile, date_UTC=date_UTC)
-        except HLSSentinelNotAvailable:
-            sentinel = None
-        except HLSSentinelMissing as e:
-            raise e
-
-        try:
-            landsat = self.landsat(tile=tile, date_UTC=date_UTC)
-        except HLSLandsatNotAvailable:
-            landsat = None
-        except HLSLandsatMissing as e:
-            raise e
+        sentinel, landsat = self.sentinel_and_landsat(tile=tile, date_UTC=date_UTC)
 
         if sentinel is None and landsat is None:
             raise HLSNotAvailable(f"HLS2 is not available at {tile} on {date_UTC}")
@@ -292,8 +442,7 @@ class HLS2CMRConnection(HLSConnection):
             except HLSBandNotAcquired:
                 raise HLSNotAvailable(f"HLS2 L30 is not available at {tile} on {date_UTC}")
         else:
-            albedo = rt.Raster(np.nanmean(np.dstack([sentinel.albedo, landsat.albedo]), axis=2),
-                               geometry=sentinel.geometry)
+            albedo = rt.Raster(nanmean_pair(sentinel.albedo, landsat.albedo), geometry=sentinel.geometry)
 
         if self.target_resolution > 30:
             albedo = albedo.to_geometry(geometry, resampling="average")
@@ -302,7 +451,7 @@ class HLS2CMRConnection(HLSConnection):
 
         if (save_data and return_filename) and not exists(product_filename):
             self.logger.info(f"saving HLS2 albedo: {cl.file(product_filename)}")
-            albedo.to_COG(product_filename)
+            write_COG(albedo, product_filename)
 
             if save_preview:
                 self.logger.info(f"saving HLS2 albedo preview: {cl.file(preview_filename)}")
@@ -364,7 +513,8 @@ class HLS2CMRConnection(HLSConnection):
                     tile=tile,
                     start_date=start_UTC,
                     end_date=end_UTC,
-                    page_size=page_size
+                    page_size=page_size,
+                    session=self._CMR_session
                 )
                 break
             except Exception as e:
@@ -378,14 +528,22 @@ class HLS2CMRConnection(HLSConnection):
                 else:
                     raise HLSServerUnreachable(f"HLS server un-reachable:")
 
-        self._granules = pd.concat([self._granules, granules]).drop_duplicates(subset=["ID", "date_UTC"])
-        logger.info(f"Currently storing {cl.val(len(self._granules))} DataGranules for HLS2")
+        with self._lock:
+            self._granules_chunks.append(granules)
+            self._granule_IDs.update(granules.ID)
+
+        logger.info(f"Currently storing {cl.val(len(self._granule_IDs))} DataGranules for HLS2")
 
         return granules
 
     def dates_listed(self, tile: str) -> Set[date]:
-        return set(
-            self._listing[self._listing.tile == tile].date_UTC.apply(lambda date_UTC: parser.parse(date_UTC).date()))
+        # copied under the lock so callers never iterate a set another tile's listing is updating
+        with self._lock:
+            return set(self._listed_dates[tile])
+
+    def remember_listing_window(self, window_key: Tuple[str, str, str], listing: pd.DataFrame):
+        with self._lock:
+            self._listing_windows[window_key] = listing
 
     def listing(
             self,
@@ -395,27 +553,42 @@ class HLS2CMRConnection(HLSConnection):
             page_size: int = PAGE_SIZE) -> (pd.DataFrame, pd.DataFrame):
         SENTINEL_REPEAT_DAYS = 5
         LANDSAT_REPEAT_DAYS = 16
-        GIVEUP_DAYS = 10
 
         tile = tile[:5]
 
         timer = Timer()
 
         if isinstance(start_UTC, str):
-            start_UTC = parser.parse(start_UTC).date()
+            start_UTC = parse_date(start_UTC)
 
         if end_UTC is None:
             end_UTC = start_UTC
 
         if isinstance(end_UTC, str):
-            end_UTC = parser.parse(end_UTC).date()
+            end_UTC = parse_date(end_UTC)
+
+        window_key = (tile, start_UTC.isoformat(), end_UTC.isoformat())
+
+        # a single lookup, since a concurrent listing may clear the memo between a check and a get
+        listing_subset = self._listing_windows.get(window_key)
+
+        if listing_subset is not None:
+            return listing_subset
 
         if set(date_range(start_UTC, end_UTC)) <= self.dates_listed(tile):
-            listing_subset = self._listing[self._listing.tile == tile]
-            listing_subset = listing_subset[listing_subset.date_UTC.apply(
-                lambda date_UTC: parser.parse(str(date_UTC)).date() >= start_UTC and parser.parse(
-                    str(date_UTC)).date() <= end_UTC)]
-            listing_subset = listing_subset.sort_values(by="date_UTC")
+            listing_subset = self.listing_window(self._listing, tile, start_UTC, end_UTC)
+            self.remember_listing_window(window_key, listing_subset)
+
+            return listing_subset
+
+        cached_listing = self.load_cached_listing(tile)
+
+        if cached_listing is not None and \
+                {date_UTC.isoformat() for date_UTC in date_range(start_UTC, end_UTC)} <= set(cached_listing.date_UTC):
+            cached_listing = cached_listing[["date_UTC", "tile", "sentinel", "landsat"]]
+            self.record_listing(tile, cached_listing)
+            listing_subset = self.listing_window(cached_listing, tile, start_UTC, end_UTC)
+            self.remember_listing_window(window_key, listing_subset)
 
             return listing_subset
 
@@ -452,66 +625,167 @@ class HLS2CMRConnection(HLSConnection):
 
         hls_granules = pd.merge(landsat_granules, sentinel_granules, how="outer")
         listing = pd.merge(dates, hls_granules, how="left")
-        date_list = list(listing.date_UTC)
+        giveup_str = giveup_date.isoformat()
+        # position of each listing row on the contiguous daily axis of the dates frame
+        day_offsets = (pd.to_datetime(listing.date_UTC, format="%Y-%m-%d") - pd.Timestamp(start_UTC)).dt.days.to_numpy()
 
-        listing["sentinel_available"] = listing.sentinel.apply(lambda sentinel: not pd.isna(sentinel))
+        listing["sentinel_available"] = listing.sentinel.notna()
 
-        sentinel_dates_expected = set()
+        sentinel_expected = repeat_pass_mask(dates.date_UTC.isin(sentinel_dates).to_numpy(), SENTINEL_REPEAT_DAYS)
+        listing["sentinel_expected"] = sentinel_expected[day_offsets]
 
-        for d in date_list:
-            if d in sentinel_dates:
-                sentinel_dates_expected.add(d)
+        listing["sentinel_missing"] = \
+            (~listing.sentinel_available) & listing.sentinel_expected & (listing.date_UTC >= giveup_str)
 
-            if (parser.parse(d).date() - timedelta(days=SENTINEL_REPEAT_DAYS)).strftime(
-                    "%Y-%m-%d") in sentinel_dates_expected:
-                sentinel_dates_expected.add(d)
+        listing["sentinel"] = listing.sentinel.mask(listing.sentinel_missing, "missing")
 
-        listing["sentinel_expected"] = listing.date_UTC.apply(lambda date_UTC: date_UTC in sentinel_dates_expected)
+        # Populate landsat with None where it's missing
+        listing["landsat_available"] = listing.landsat.notna()
 
-        listing["sentinel_missing"] = listing.apply(
-            lambda row: not row.sentinel_available and row.sentinel_expected and parser.parse(
-                str(row.date_UTC)) >= parser.parse(str(giveup_date)),
-            axis=1
-        )
+        landsat_expected = repeat_pass_mask(dates.date_UTC.isin(landsat_dates).to_numpy(), LANDSAT_REPEAT_DAYS)
+        listing["landsat_expected"] = landsat_expected[day_offsets]
 
-        listing["sentinel"] = listing.apply(lambda row: "missing" if row.sentinel_missing else row.sentinel, axis=1)
+        listing["landsat_missing"] = \
+            (~listing.landsat_available) & listing.landsat_expected & (listing.date_UTC >= giveup_str)
 
-        # Populate landsat with None where it's missing
-        listing["landsat_available"] = listing.landsat.apply(lambda landsat: not pd.isna(landsat))
+        listing["landsat"] = listing.landsat.mask(listing.landsat_missing, "missing")
+        listing = listing[["date_UTC", "tile", "sentinel", "landsat"]]
 
-        landsat_dates_expected = set()
+        self.logger.info(
+            f"finished listing available HLS2 granules at tile {cl.place(tile)} from {cl.time(start_UTC)} to {cl.time(end_UTC)} ({timer})")
 
-        for d in date_list:
-            if d in landsat_dates:
-                landsat_dates_expected.add(d)
+        self.record_listing(tile, listing)
+        self.save_cached_listing(tile, listing, cached_listing)
+        self.remember_listing_window(window_key, listing)
 
-            if (parser.parse(d).date() - timedelta(days=LANDSAT_REPEAT_DAYS)).strftime(
-                    "%Y-%m-%d") in landsat_dates_expected:
-                landsat_dates_expected.add(d)
+        return listing
 
-        # listing["landsat_expected"] = listing.apply(lambda row: parser.parse(str(row.date_UTC)).date().strftime("%Y-%m-%d") in landsat_dates_expected, axis=1)
-        listing["landsat_expected"] = listing.date_UTC.apply(
-            lambda date_UTC: parser.parse(str(date_UTC)).date().strftime("%Y-%m-%d") in landsat_dates_expected)
+    def listings(
+            self,
+            tiles: List[str],
+            start_UTC: Union[date, str],
+            end_UTC: Union[date, str] = None,
+            page_size: int = PAGE_SIZE) -> pd.DataFrame:
+        tiles = list(dict.fromkeys(tile[:5] for tile in tiles))
 
-        listing["landsat_missing"] = listing.apply(
-            lambda row: not row.landsat_available and row.landsat_expected and parser.parse(
-                str(row.date_UTC)) >= parser.parse(str(giveup_date)),
-            axis=1
-        )
+        if len(tiles) == 0:
+            return pd.DataFrame([], columns=["date_UTC", "tile", "sentinel", "landsat"])
 
-        listing["landsat"] = listing.apply(lambda row: "missing" if row.landsat_missing else row.landsat, axis=1)
-        listing = listing[["date_UTC", "tile", "sentinel", "landsat"]]
+        # each tile is a separate CMR round-trip, so the tiles are listed concurrently
+        with ThreadPoolExecutor(max_workers=min(len(tiles), DEFAULT_PROCESS_THREADS)) as executor:
+            futures = [
+                executor.submit(self.listing, tile=tile, start_UTC=start_UTC, end_UTC=end_UTC, page_size=page_size)
+                for tile
+                in tiles
+            ]
 
-        self.logger.info(
-            f"finished listing available HLS2 granules at tile {cl.place(tile)} from {cl.time(start_UTC)} to {cl.time(end_UTC)} ({timer})")
+            listings = [future.result() for future in futures]
 
-        self._listing = pd.concat([self._listing, listing]).drop_duplicates(subset=["date_UTC", "tile"])
+        return pd.concat(listings)
 
-        return listing
+    def listing_window(self, listing: pd.DataFrame, tile: str, start_UTC: date, end_UTC: date) -> pd.DataFrame:
+        listing_subset = listing[listing.tile == tile]
+        # ISO date strings compare in chronological order
+        listing_subset = listing_subset[
+            (listing_subset.date_UTC >= start_UTC.isoformat()) & (listing_subset.date_UTC <= end_UTC.isoformat())]
+
+        # listings computed for one window are already in date order, only merged chunks need sorting
+        if not listing_subset.date_UTC.is_monotonic_increasing:
+            listing_subset = listing_subset.sort_values(by="date_UTC")
+
+        return listing_subset
+
+    def record_listing(self, tile: str, listing: pd.DataFrame):
+        listed_dates = {date.fromisoformat(date_UTC) for date_UTC in listing.date_UTC}
+
+        with self._lock:
+            self._listing_chunks.append(listing)
+            self._listing_windows.clear()
+            self._listed_dates[tile].update(listed_dates)
+
+    def cached_listing_filename(self, tile: str) -> str:
+        return join(self._listing_cache_directory, f"{tile}.json")
+
+    def load_cached_listing(self, tile: str) -> Union[pd.DataFrame, None]:
+        filename = self.cached_listing_filename(tile)
+
+        if not exists(filename):
+            return None
+
+        try:
+            with open(filename, "r") as file:
+                rows = json.load(file)
+        except Exception as e:
+            logger.warning(f"unable to read cached HLS2 listing: {filename}")
+            logger.warning(format_exception(e))
+            return None
+
+        # each row expires on its own, since every save rewrites the file with the rows still fresh
+        expiration_time = unix_time() - LISTING_CACHE_TTL_SECONDS
+        rows = [row for row in rows if row["listed_at"] >= expiration_time]
+
+        if len(rows) == 0:
+            return None
+
+        cached_listing = pd.DataFrame(rows, columns=["date_UTC", "tile", "sentinel", "landsat", "listed_at"])
+
+        for sensor in ("sentinel", "landsat"):
+            cached_listing[sensor] = [
+                earthaccess.search.DataGranule(granule, cloud_hosted=True) if isinstance(granule, dict)
+                else np.nan if granule is None
+                else granule
+                for granule
+                in cached_listing[sensor]
+            ]
+
+        logger.info(f"loaded cached HLS2 listing for tile {cl.place(tile)}: {cl.file(filename)}")
+
+        return cached_listing
+
+    def save_cached_listing(self, tile: str, listing: pd.DataFrame, cached_listing: pd.DataFrame = None):
+        filename = self.cached_listing_filename(tile)
+        listing = listing.assign(listed_at=unix_time())
+
+        # recent dates without both granules may still be filled in on CMR, so only settled rows are cached
+        giveup_date = (datetime.utcnow().date() - timedelta(days=GIVEUP_DAYS)).isoformat()
+        settled = (listing.date_UTC < giveup_date) | (
+                listing.sentinel.map(lambda granule: isinstance(granule, dict)) &
+                listing.landsat.map(lambda granule: isinstance(granule, dict)))
+        listing = listing[settled]
+
+        if cached_listing is not None:
+            # freshly listed rows take precedence over cached rows, which keep their own listing times
+            listing = pd.concat([listing, cached_listing]).drop_duplicates(subset=["date_UTC", "tile"])
+            listing = listing.sort_values(by="date_UTC")
+
+        rows = [
+            {
+                "date_UTC": row.date_UTC,
+                "tile": row.tile,
+                "sentinel": row.sentinel if isinstance(row.sentinel, (dict, str)) else None,
+                "landsat": row.landsat if isinstance(row.landsat, (dict, str)) else None,
+                "listed_at": row.listed_at
+            }
+            for row
+            in listing.itertuples()
+        ]
+
+        # JSON rather than pickle, so reading the products directory never executes code written into it
+        try:
+            makedirs(self._listing_cache_directory, exist_ok=True)
+            partial_filename = f"{filename}.tmp"
+
+            with open(partial_filename, "w") as file:
+                json.dump(rows, file)
+
+            os.replace(partial_filename, filename)
+        except Exception as e:
+            logger.warning(f"unable to write cached HLS2 listing: {filename}")
+            logger.warning(format_exception(e))
 
     def sentinel_granule(self, tile: str, date_UTC: Union[date, str]) -> earthaccess.search.DataGranule:
         if isinstance(date_UTC, str):
-            date_UTC = parser.parse(date_UTC).date()
+            date_UTC = parse_date(date_UTC)
 
         listing = self.listing(tile=tile, start_UTC=date_UTC, end_UTC=date_UTC)
         granule = listing.iloc[-1].sentinel
@@ -527,7 +801,7 @@ class HLS2CMRConnection(HLSConnection):
 
     def landsat_granule(self, tile: str, date_UTC: Union[date, str]) -> earthaccess.search.DataGranule:
         if isinstance(date_UTC, str):
-            date_UTC = parser.parse(date_UTC).date()
+            date_UTC = parse_date(date_UTC)
 
         listing = self.listing(tile=tile, start_UTC=date_UTC, end_UTC=date_UTC)
         granule = listing.iloc[-1].landsat
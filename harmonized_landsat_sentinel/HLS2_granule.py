@@ -1,17 +1,35 @@
-from typing import List
+from typing import List, Dict, Tuple
 
+import os
+import re
+import weakref
+from collections import OrderedDict
+from functools import cached_property
 from os.path import basename, join
 
-from glob import glob
-
 import numpy as np
-import rasters as rt
+import rasterio
 from rasters import Raster
 
 from .constants import *
 from .exceptions import *
 from .HLS_granule import HLSGranule
 from .HLS_granule_ID import HLSGranuleID
+from .kernels import decode_fmask, scale_mask
+
+BAND_FILENAME_PATTERN = re.compile(r"^.+\.([^.]+)\.tif$")
+
+
+def _shallow_copy(image: Raster) -> Raster:
+    # a new Raster sharing the array, since Raster() copies float arrays and copy.copy recurses through __getattr__
+    duplicate = Raster.__new__(Raster)
+    duplicate.__dict__.update({
+        key: dict(value) if isinstance(value, dict) else value
+        for key, value
+        in image.__dict__.items()
+    })
+
+    return duplicate
 
 class HLS2Granule(HLSGranule):
     def __init__(self, directory: str, connection=None):
@@ -19,36 +37,71 @@ class HLS2Granule(HLSGranule):
         self.directory = directory
         self.ID = HLSGranuleID(basename(directory))
         self.connection = connection
+        # band rasters are only held while a caller references them so processed granules can be reclaimed
+        self.band_images = weakref.WeakValueDictionary()
+        # the most recently scaled and masked bands keyed by (band, apply_scale, apply_cloud), reused across
+        # derived indices, bounded so a long-lived granule does not hold every band it has processed
+        self._processed = OrderedDict()
 
     def __repr__(self) -> str:
         return f"HLS2Granule({self.directory})"
 
-    @property
+    def invalidate(self):
+        """drop cached file listings and rasters so the granule is re-read from disk"""
+        self._processed.clear()
+        self.band_images.clear()
+
+        for attribute in ("filenames", "_band_index", "Fmask", "_masks"):
+            self.__dict__.pop(attribute, None)
+
+    @cached_property
     def filenames(self) -> List[str]:
-        return sorted(glob(join(self.directory, f"*.*")))
+        # a single directory scan, shared with the band index; hidden and extensionless entries are skipped
+        with os.scandir(self.directory) as entries:
+            names = [entry.name for entry in entries if "." in entry.name and not entry.name.startswith(".")]
+
+        return sorted(join(self.directory, name) for name in names)
+
+    @cached_property
+    def _band_index(self) -> Dict[str, str]:
+        # map band name to the latest matching file from the cached directory scan
+        index = {}
+
+        for name in map(basename, self.filenames):
+            match = BAND_FILENAME_PATTERN.match(name)
+
+            if match is not None:
+                index[match.group(1)] = name
+
+        return index
 
     def band_filename(self, band: str) -> str:
         band = self.band_name(band)
-        pattern = join(self.directory, f"*.{band}.tif")
-        filenames = sorted(glob(pattern))
 
-        if len(filenames) == 0:
+        try:
+            return join(self.directory, self._band_index[band])
+        except KeyError:
             raise HLSBandNotAcquired(f"no file found for band {band} for granule {self.ID}")
 
-        return filenames[-1]
-
     def DN(self, band: str) -> Raster:
-        if band in self.band_images:
-            return self.band_images[band]
+        image = self.band_images.get(band)
+
+        if image is not None:
+            return image
 
         filename = self.band_filename(band)
-        image = Raster.open(filename)
+
+        # decompress COG blocks on all cores with a bounded block cache and no sidecar directory scan
+        with rasterio.Env(**GDAL_READ_OPTIONS):
+            image = Raster.open(filename)
+
         self.band_images[band] = image
 
         return image
 
-    @property
+    @cached_property
     def Fmask(self) -> Raster:
+        # the quality layer backs the geometry and cloud masks, so it is held for the life of the granule
         return self.DN("Fmask")
 
     @property
@@ -59,23 +112,47 @@ class HLS2Granule(HLSGranule):
     def geometry(self):
         return self.QA.geometry
 
+    @cached_property
+    def _masks(self) -> Tuple[Raster, Raster]:
+        QA = self.QA
+        fmask = np.ascontiguousarray(QA.array)
+        cloud = np.empty(fmask.shape, dtype=np.bool_)
+        water = np.empty(fmask.shape, dtype=np.bool_)
+        decode_fmask(fmask.ravel(), cloud.ravel(), water.ravel())
+
+        return Raster(cloud, geometry=QA.geometry), Raster(water, geometry=QA.geometry)
+
     @property
     def cloud(self) -> Raster:
-        return (self.QA & 15 > 0).color(CLOUD_CMAP)
+        return self._masks[0].color(CLOUD_CMAP)
 
     @property
     def water(self) -> Raster:
-        return ((self.QA >> 5) & 1 == 1).color(WATER_CMAP)
+        return self._masks[1].color(WATER_CMAP)
 
     def band(self, band: str, apply_scale: bool = True, apply_cloud: bool = True) -> Raster:
+        key = (self.band_name(band), apply_scale, apply_cloud)
+
+        image = self._processed.get(key)
+
+        # each call gets a shallow copy sharing the memoized array, since callers set cmap in place
+        if image is not None:
+            self._processed.move_to_end(key)
+            return _shallow_copy(image)
+
         image = self.DN(band)
 
-        if apply_scale:
-            image = rt.where(image == -1000, np.nan, image * 0.0001)
-            image = rt.where(image < 0, np.nan, image)
-            image.nodata = np.nan
+        if not apply_scale and not apply_cloud:
+            return image
 
-        if apply_cloud:
-            image = rt.where(self.cloud, np.nan, image)
+        DN = np.ascontiguousarray(image.array)
+        fmask = np.ascontiguousarray(self.Fmask.array) if apply_cloud else DN
+        array = np.empty(DN.shape, dtype=np.float32)
+        scale_mask(DN.ravel(), fmask.ravel(), array.ravel(), apply_scale, apply_cloud)
+        image = Raster(array, geometry=image.geometry, nodata=np.nan)
+        self._processed[key] = image
 
-        return image
+        if len(self._processed) > PROCESSED_BAND_CACHE_SIZE:
+            self._processed.popitem(last=False)
+
+        return _shallow_copy(image)
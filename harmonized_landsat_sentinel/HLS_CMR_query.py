@@ -1,10 +1,13 @@
 from typing import Union, List
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
-from dateutil import parser
+
+import requests
 
 import earthaccess
 
+import numpy as np
 import pandas as pd
 
 from .constants import *
@@ -14,33 +17,84 @@ from .get_CMR_granule_ID import get_CMR_granule_ID
 from .latest_datetime import latest_datetime
 
 
+def CMR_granule_items(
+        session: requests.Session,
+        concept_ID: str,
+        tile: str,
+        start_date: Union[date, str],
+        end_date: Union[date, str],
+        page_size: int = PAGE_SIZE) -> List[dict]:
+    """function to page through the UMM JSON granule records of one collection"""
+    params = {
+        "collection_concept_id": concept_ID,
+        "temporal": f"{earliest_datetime(start_date):%Y-%m-%dT%H:%M:%SZ},{latest_datetime(end_date):%Y-%m-%dT%H:%M:%SZ}",
+        "readable_granule_name": f"*.T{tile}.*",
+        "options[readable_granule_name][pattern]": "true",
+        "page_size": page_size,
+    }
+
+    headers = {}
+    items = []
+
+    while True:
+        response = session.get(CMR_GRANULES_UMM_JSON_URL, params=params, headers=headers)
+        response.raise_for_status()
+        page = response.json()["items"]
+        items.extend(page)
+
+        search_after = response.headers.get("CMR-Search-After")
+
+        if len(page) < page_size or search_after is None:
+            break
+
+        headers["CMR-Search-After"] = search_after
+
+    return items
+
+
 def HLS_CMR_query(
         tile: str,
         start_date: Union[date, str],
         end_date: Union[date, str],
-        page_size: int = PAGE_SIZE) -> pd.DataFrame:
+        page_size: int = PAGE_SIZE,
+        session: requests.Session = None) -> pd.DataFrame:
     """function to search for HLS at tile in date range"""
+    if session is None:
+        # a session opened here is closed once the query is done
+        with requests.Session() as session:
+            return HLS_CMR_query(tile, start_date, end_date, page_size=page_size, session=session)
+
     granules: List[earthaccess.search.DataGranule]
     try:
-        granules = earthaccess.granule_query() \
-            .concept_id([L30_CONCEPT, S30_CONCEPT]) \
-            .temporal(earliest_datetime(start_date), latest_datetime(end_date)) \
-            .readable_granule_name(f"*.T{tile}.*") \
-            .get()
+        # the Landsat and Sentinel collections are paged concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(CMR_granule_items, session, concept_ID, tile, start_date, end_date, page_size)
+                for concept_ID
+                in [L30_CONCEPT, S30_CONCEPT]
+            ]
+
+            items = [item for future in futures for item in future.result()]
     except Exception as e:
         raise CMRServerUnreachable(e)
 
-    granules = sorted(granules, key=lambda granule: granule["umm"]["TemporalExtent"]["RangeDateTime"]["BeginningDateTime"])
-    data = list(map(
-        lambda granule: {
-            "ID": get_CMR_granule_ID(granule),
-            "sensor": get_CMR_granule_ID(granule).split(".")[1],
-            "tile": get_CMR_granule_ID(granule).split(".")[2][1:],
-            "date_UTC": parser.parse(granule["umm"]["TemporalExtent"]["RangeDateTime"]["BeginningDateTime"]).date().strftime("%Y-%m-%d"),
-            "timestamp_str": granule["umm"]["TemporalExtent"]["RangeDateTime"]["BeginningDateTime"],
-            "granule": granule,
-        },
-        granules
-    ))
-
-    return pd.DataFrame(data, columns=["ID", "sensor", "tile", "date_UTC", "timestamp_str", "granule"])
+    if len(items) == 0:
+        return pd.DataFrame([], columns=["ID", "sensor", "tile", "date_UTC", "timestamp_str", "granule"])
+
+    # extract the ISO 8601 start times once, they sort chronologically as strings
+    timestamps = [item["umm"]["TemporalExtent"]["RangeDateTime"]["BeginningDateTime"] for item in items]
+    order = np.argsort(timestamps, kind="stable")
+    granules = [earthaccess.search.DataGranule(items[i], cloud_hosted=True) for i in order]
+
+    df = pd.DataFrame({
+        "ID": [get_CMR_granule_ID(granule) for granule in granules],
+        "timestamp_str": [timestamps[i] for i in order],
+        "granule": granules,
+    })
+
+    ID_parts = df.ID.str.split(".", n=3, expand=True)
+    df["sensor"] = ID_parts[1]
+    df["tile"] = ID_parts[2].str[1:]
+    df["date_UTC"] = pd.to_datetime(df.timestamp_str, utc=True, format="ISO8601").dt.strftime("%Y-%m-%d")
+
+    return df[["ID", "sensor", "tile", "date_UTC", "timestamp_str", "granule"]]
@@ -1,20 +1,21 @@
 import logging
 import os
+import threading
 import urllib
 from abc import abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timedelta
 from fnmatch import fnmatch
 from glob import glob
 from os import makedirs, system
 from os.path import join, abspath, expanduser, exists, getsize, dirname
 from shutil import move
-from typing import Union, List
+from typing import Union, List, Dict, Tuple
 import logging
 import numpy as np
 import pandas as pd
 import requests
 from bs4 import BeautifulSoup
-from dateutil import parser
 from sentinel_tiles import SentinelTileGrid
 
 import colored_logging as cl
@@ -25,9 +26,12 @@ from rasters import Raster, RasterGeometry, SpatialGeometry
 from .HLS_landsat_granule import HLSLandsatGranule
 from .HLS_sentinel_granule import HLSSentinelGranule
 from .constants import *
+from .parse_date import parse_date
 from .exceptions import *
 from .timer import Timer
+from .write_COG import write_COG
 from .daterange import date_range
+from .kernels import initialize_threading_layer
 
 logger = logging.getLogger(__name__)
 
@@ -65,6 +69,8 @@ class HLSConnection:
         self.tile_grid = SentinelTileGrid(target_resolution=target_resolution)
         self._listings = {}
         self.unavailable_dates = {}
+        # process() marks dates from several worker threads
+        self._unavailable_dates_lock = threading.Lock()
         self.remote = None
 
     def __repr__(self):
@@ -80,23 +86,24 @@ class HLSConnection:
 
     def mark_date_unavailable(self, sensor: str, tile: str, date_UTC: Union[date, str]):
         if isinstance(date_UTC, str):
-            date_UTC = parser.parse(date_UTC).date()
+            date_UTC = parse_date(date_UTC)
 
         date_UTC = date_UTC.strftime("%Y-%m-%d")
 
         tile = tile[:5]
 
-        if sensor not in self.unavailable_dates:
-            self.unavailable_dates[sensor] = {}
+        with self._unavailable_dates_lock:
+            if sensor not in self.unavailable_dates:
+                self.unavailable_dates[sensor] = {}
 
-        if tile not in self.unavailable_dates[sensor]:
-            self.unavailable_dates[sensor][tile] = []
+            if tile not in self.unavailable_dates[sensor]:
+                self.unavailable_dates[sensor][tile] = set()
 
-        self.unavailable_dates[sensor][tile].append(date_UTC)
+            self.unavailable_dates[sensor][tile].add(date_UTC)
 
     def check_unavailable_date(self, sensor: str, tile: str, date_UTC: Union[date, str]) -> bool:
         if isinstance(date_UTC, str):
-            date_UTC = parser.parse(date_UTC).date()
+            date_UTC = parse_date(date_UTC)
 
         date_UTC = date_UTC.strftime("%Y-%m-%d")
 
@@ -216,13 +223,13 @@ class HLSConnection:
             f"started listing available HLS2 granules at tile {cl.place(tile)} from {cl.time(start_UTC)} to {cl.time(end_UTC)}")
 
         if isinstance(start_UTC, str):
-            start_UTC = parser.parse(start_UTC).date()
+            start_UTC = parse_date(start_UTC)
 
         if end_UTC is None:
             end_UTC = start_UTC
 
         if isinstance(end_UTC, str):
-            end_UTC = parser.parse(end_UTC).date()
+            end_UTC = parse_date(end_UTC)
 
         giveup_date = datetime.utcnow().date() - timedelta(days=GIVEUP_DAYS)
         search_start = start_UTC - timedelta(days=max(SENTINEL_REPEAT_DAYS, LANDSAT_REPEAT_DAYS))
@@ -251,15 +258,15 @@ class HLSConnection:
 
         listing = listing[listing.date_UTC >= str(start_UTC)]
         listing.date_UTC = listing.date_UTC.apply(
-            lambda date_UTC: parser.parse(str(date_UTC)).date().strftime("%Y-%m-%d"))
+            lambda date_UTC: parse_date(str(date_UTC)).strftime("%Y-%m-%d"))
         dates = pd.DataFrame(
             {"date_UTC": [date_UTC.strftime("%Y-%m-%d") for date_UTC in date_range(start_UTC, end_UTC)], "tile": tile})
         listing = pd.merge(dates, listing, how="left")
-        listing.date_UTC = listing.date_UTC.apply(lambda date_UTC: parser.parse(date_UTC).date())
+        listing.date_UTC = listing.date_UTC.apply(lambda date_UTC: parse_date(date_UTC))
         listing = listing.sort_values(by="date_UTC")
         listing["sentinel_available"] = listing.apply(lambda row: not pd.isna(row.sentinel), axis=1)
         listing["sentinel_expected"] = listing.apply(
-            lambda row: parser.parse(str(row.date_UTC)).date() in sentinel_dates, axis=1)
+            lambda row: parse_date(str(row.date_UTC)) in sentinel_dates, axis=1)
 
         listing["sentinel_missing"] = listing.apply(
             lambda row: not row.sentinel_available and row.sentinel_expected and row.date_UTC >= giveup_date,
@@ -268,7 +275,7 @@ class HLSConnection:
 
         listing["sentinel"] = listing.apply(lambda row: "missing" if row.sentinel_missing else row.sentinel, axis=1)
         listing["landsat_available"] = listing.apply(lambda row: not pd.isna(row.landsat), axis=1)
-        listing["landsat_expected"] = listing.apply(lambda row: parser.parse(str(row.date_UTC)).date() in landsat_dates,
+        listing["landsat_expected"] = listing.apply(lambda row: parse_date(str(row.date_UTC)) in landsat_dates,
                                                     axis=1)
 
         listing["landsat_missing"] = listing.apply(
@@ -285,7 +292,7 @@ class HLSConnection:
 
     def sentinel_filename(self, tile: str, date_UTC: Union[date, str]):
         if isinstance(date_UTC, str):
-            date_UTC = parser.parse(date_UTC).date()
+            date_UTC = parse_date(date_UTC)
 
         listing = self.listing(tile=tile, start_UTC=(date_UTC - timedelta(days=5)), end_UTC=date_UTC)
         filename = str(listing.iloc[-1].sentinel)
@@ -303,7 +310,7 @@ class HLSConnection:
 
     def landsat_filename(self, tile: str, date_UTC: Union[date, str]):
         if isinstance(date_UTC, str):
-            date_UTC = parser.parse(date_UTC).date()
+            date_UTC = parse_date(date_UTC)
 
         filename = str(self.listing(tile=tile, start_UTC=date_UTC, end_UTC=date_UTC).iloc[0].landsat)
 
@@ -350,7 +357,7 @@ class HLSConnection:
 
     def local_directory(self, date_UTC: Union[date, str]) -> str:
         if isinstance(date_UTC, str):
-            date_UTC = parser.parse(date_UTC).date()
+            date_UTC = parse_date(date_UTC)
 
         directory = join(self.download_directory, f"{date_UTC:%Y.%m.%d}")
 
@@ -358,7 +365,7 @@ class HLSConnection:
 
     def local_sentinel_filename(self, tile: str, date_UTC: Union[date, str]) -> str:
         if isinstance(date_UTC, str):
-            date_UTC = parser.parse(date_UTC).date()
+            date_UTC = parse_date(date_UTC)
 
         if self.check_unavailable_date("Sentinel", tile, date_UTC):
             raise HLSSentinelNotAvailable(f"Sentinel is not available at tile {cl.place(tile)} on {cl.time(date_UTC)}")
@@ -379,7 +386,7 @@ class HLSConnection:
 
     def local_landsat_filename(self, tile: str, date_UTC: Union[date, str]) -> str:
         if isinstance(date_UTC, str):
-            date_UTC = parser.parse(date_UTC).date()
+            date_UTC = parse_date(date_UTC)
 
         if self.check_unavailable_date("Landsat", tile, date_UTC):
             # logger.error(self.unavailable_dates["Landsat"][tile])
@@ -400,7 +407,7 @@ class HLSConnection:
 
     def sentinel(self, tile: str, date_UTC: Union[date, str]) -> HLSSentinelGranule:
         if isinstance(date_UTC, str):
-            date_UTC = parser.parse(date_UTC).date()
+            date_UTC = parse_date(date_UTC)
 
         logger.info(f"searching for Sentinel tile {cl.name(tile)} on {cl.time(date_UTC)}")
         filename = self.local_sentinel_filename(tile=tile, date_UTC=date_UTC)
@@ -418,7 +425,7 @@ class HLSConnection:
 
     def landsat(self, tile: str, date_UTC: Union[date, str]) -> HLSLandsatGranule:
         if isinstance(date_UTC, str):
-            date_UTC = parser.parse(date_UTC).date()
+            date_UTC = parse_date(date_UTC)
 
         logger.info(f"searching for Landsat tile {cl.name(tile)} on {cl.time(date_UTC)}")
         filename = self.local_landsat_filename(tile=tile, date_UTC=date_UTC)
@@ -443,6 +450,9 @@ class HLSConnection:
             save_data: bool = True,
             save_preview: bool = True,
             return_filename: bool = False) -> Union[Raster, str]:
+        if isinstance(date_UTC, str):
+            date_UTC = parse_date(date_UTC)
+
         target_tile = tile
         target_geometry = self.grid(target_tile)
         tile = tile[:5]
@@ -495,7 +505,7 @@ class HLSConnection:
 
         if (save_data or return_filename) and not exists(product_filename):
             self.logger.info(f"saving HLS2 NDVI: {cl.file(product_filename)}")
-            NDVI.to_COG(product_filename)
+            write_COG(NDVI, product_filename)
 
             if save_preview:
                 self.logger.info(f"saving HLS2 NDVI preview: {cl.file(preview_filename)}")
@@ -519,6 +529,9 @@ class HLSConnection:
             save_data: bool = True,
             save_preview: bool = True,
             return_filename: bool = False) -> Union[Raster, str]:
+        if isinstance(date_UTC, str):
+            date_UTC = parse_date(date_UTC)
+
         target_tile = tile
         target_geometry = self.grid(target_tile)
         tile = tile[:5]
@@ -573,7 +586,7 @@ class HLSConnection:
 
         if (save_data or return_filename) and not exists(product_filename):
             self.logger.info(f"saving HLS2 {product}: {cl.file(product_filename)}")
-            image.to_COG(product_filename)
+            write_COG(image, product_filename)
 
             if save_preview:
                 self.logger.info(f"saving HLS2 {product} preview: {cl.file(preview_filename)}")
@@ -592,22 +605,59 @@ class HLSConnection:
             end: Union[date, str],
             target: str,
             target_geometry: Union[SpatialGeometry, str] = None,
-            product_names: List[str] = None):
+            product_names: List[str] = None,
+            threads: int = DEFAULT_PROCESS_THREADS) -> Dict[Tuple[date, str], str]:
         if product_names is None:
             product_names = DEFAULT_PRODUCTS
 
-        for date_UTC in date_range(start, end):
-            self.product()
+        if isinstance(target_geometry, str):
+            target_geometry = self.grid(target_geometry)
+
+        geometry = target_geometry if isinstance(target_geometry, RasterGeometry) else None
+        dates = list(date_range(start, end))
+
+        if len(dates) == 0:
+            return {}
+
+        # list the whole range up front so the workers resolve their dates from the cached listing
+        self.listing(tile=target[:5], start_UTC=dates[0], end_UTC=dates[-1])
+
+        def process_date(date_UTC: date) -> Dict[Tuple[date, str], str]:
+            # products on the same date share granule files, so they are generated in turn by one worker
+            filenames = {}
+
+            for product in product_names:
+                try:
+                    filenames[(date_UTC, product)] = self.product(
+                        product=product,
+                        tile=target,
+                        date_UTC=date_UTC,
+                        geometry=geometry,
+                        return_filename=True
+                    )
+                except (HLSNotAvailable, HLSSentinelMissing, HLSLandsatMissing, HLSBandNotAcquired) as e:
+                    self.logger.warning(e)
+
+            return filenames
+
+        initialize_threading_layer()
+        filenames = {}
+
+        with ThreadPoolExecutor(max_workers=min(threads, len(dates))) as executor:
+            for date_filenames in executor.map(process_date, dates):
+                filenames.update(date_filenames)
+
+        return filenames
 
     def product_directory(self, product: str, date_UTC: Union[date, str]):
         if isinstance(date_UTC, str):
-            date_UTC = parser.parse(date_UTC).date()
+            date_UTC = parse_date(date_UTC)
 
         return join(self.products_directory, product, f"{date_UTC:%Y.%m.%d}")
 
     def product_filename(self, product: str, date_UTC: Union[date, str], tile: str):
         if isinstance(date_UTC, str):
-            date_UTC = parser.parse(date_UTC).date()
+            date_UTC = parse_date(date_UTC)
 
         directory = self.product_directory(product=product, date_UTC=date_UTC)
         filename = join(directory, f"HLS_{tile}_{date_UTC:%Y%m%d}_{product}.tif")
@@ -624,6 +674,9 @@ class HLSConnection:
             save_preview: bool = False,
             return_filename: bool = False) -> Union[Raster, str]:
 
+        if isinstance(date_UTC, str):
+            date_UTC = parse_date(date_UTC)
+
         target_tile = tile
         target_geometry = self.grid(target_tile)
         tile = tile[:5]
@@ -677,7 +730,7 @@ class HLSConnection:
 
         if (save_data and return_filename) and not exists(product_filename):
             self.logger.info(f"saving HLS2 albedo: {cl.file(product_filename)}")
-            albedo.to_COG(product_filename)
+            write_COG(albedo, product_filename)
 
             if save_preview:
                 self.logger.info(f"saving HLS2 albedo preview: {cl.file(preview_filename)}")
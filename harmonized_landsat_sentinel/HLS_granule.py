@@ -1,4 +1,3 @@
-import warnings
 from abc import abstractmethod
 from typing import List, Union
 
@@ -9,6 +8,7 @@ import rasters as rt
 from rasters import Raster, MultiRaster
 
 from .constants import *
+from .normalized_difference import normalized_difference
 
 
 class HLSGranule:
@@ -53,19 +53,20 @@ class HLSGranule:
 
     def band_name(self, band: Union[str, int]) -> str:
         if isinstance(band, int):
-            band = f"B{band:02d}"
+            return BAND_NAMES.get(band) or f"B{band:02d}"
 
         return band
 
     def band(self, band: Union[str, int], apply_scale: bool = True, apply_cloud: bool = True) -> Raster:
         image = self.DN(band)
 
+        # float32 scalars keep the scaled bands single precision instead of promoting to float64
         if apply_scale:
-            image = rt.where(image == -1000, np.nan, image * 0.0001)
-            image = rt.where(image < 0, np.nan, image)
+            image = rt.where(image == -1000, np.float32(np.nan), image * np.float32(0.0001))
+            image = rt.where(image < 0, np.float32(np.nan), image)
 
         if apply_cloud:
-            image = rt.where(self.cloud, np.nan, image)
+            image = rt.where(self.cloud, np.float32(np.nan), image)
 
         return image
 
@@ -133,10 +134,7 @@ class HLSGranule:
 
     @property
     def NDVI(self) -> Raster:
-        image = (self.NIR - self.red) / (self.NIR + self.red)
-        image.cmap = NDVI_CMAP
-
-        return image
+        return normalized_difference(self.NIR, self.red).color(NDVI_CMAP)
 
     @property
     @abstractmethod
@@ -145,33 +143,15 @@ class HLSGranule:
 
     @property
     def NDSI(self) -> Raster:
-        warnings.filterwarnings("ignore")
-        NDSI = (self.green - self.SWIR1) / (self.green + self.SWIR1)
-        NDSI = rt.clip(NDSI, -1, 1)
-        NDSI = NDSI.astype(np.float32)
-        NDSI = NDSI.color("jet")
-
-        return NDSI
+        return normalized_difference(self.green, self.SWIR1).color("jet")
 
     @property
     def MNDWI(self) -> Raster:
-        warnings.filterwarnings("ignore")
-        MNDWI = (self.green - self.SWIR1) / (self.green + self.SWIR1)
-        MNDWI = rt.clip(MNDWI, -1, 1)
-        MNDWI = MNDWI.astype(np.float32)
-        MNDWI = MNDWI.color("jet")
-
-        return MNDWI
+        return normalized_difference(self.green, self.SWIR1).color("jet")
 
     @property
     def NDWI(self) -> Raster:
-        warnings.filterwarnings("ignore")
-        NDWI = (self.green - self.NIR) / (self.green + self.NIR)
-        NDWI = rt.clip(NDWI, -1, 1)
-        NDWI = NDWI.astype(np.float32)
-        NDWI = NDWI.color("jet")
-
-        return NDWI
+        return normalized_difference(self.green, self.NIR).color("jet")
 
     # @property
     # def WRI(self) -> Raster:
@@ -184,13 +164,7 @@ class HLSGranule:
 
     @property
     def moisture(self) -> Raster:
-        warnings.filterwarnings("ignore")
-        moisture = (self.NIR - self.SWIR1) / (self.NIR + self.SWIR1)
-        moisture = rt.clip(moisture, -1, 1)
-        moisture = moisture.astype(np.float32)
-        moisture = moisture.color("jet")
-
-        return moisture
+        return normalized_difference(self.NIR, self.SWIR1).color("jet")
 
     def product(self, product: str) -> Raster:
         return getattr(self, product)
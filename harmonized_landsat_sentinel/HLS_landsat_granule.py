@@ -2,6 +2,7 @@ import rasters as rt
 from rasters import Raster
 
 from .constants import *
+from .weighted_band_sum import weighted_band_sum
 from .HLS_granule import HLSGranule
 
 class HLSLandsatGranule(HLSGranule):
@@ -48,8 +49,11 @@ class HLSLandsatGranule(HLSGranule):
 
     @property
     def albedo(self) -> Raster:
-        albedo = ((0.356 * self.blue) + (0.130 * self.green) + (0.373 * self.red) + (0.085 * self.NIR) + (
-                0.072 * self.SWIR1) - 0.018) / 1.016
+        albedo = weighted_band_sum(
+            [self.blue, self.green, self.red, self.NIR, self.SWIR1],
+            [0.356 / 1.016, 0.130 / 1.016, 0.373 / 1.016, 0.085 / 1.016, 0.072 / 1.016],
+            offset=-0.018 / 1.016
+        )
         albedo.cmap = ALBEDO_CMAP
 
         return albedo
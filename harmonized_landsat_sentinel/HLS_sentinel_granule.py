@@ -1,6 +1,7 @@
 from rasters import Raster, MultiRaster
 
 from .constants import *
+from .weighted_band_sum import weighted_band_sum
 from .HLS_granule import HLSGranule
 
 class HLSSentinelGranule(HLSGranule):
@@ -58,16 +59,20 @@ class HLSSentinelGranule(HLSGranule):
 
     @property
     def albedo(self) -> Raster:
-        albedo = \
-            0.1324 * self.blue + \
-            0.1269 * self.green + \
-            0.1051 * self.red + \
-            0.0971 * self.rededge1 + \
-            0.0890 * self.rededge2 + \
-            0.0818 * self.rededge3 + \
-            0.0722 * self.NIR_broad + \
-            0.0167 * self.SWIR1 + \
-            0.0002 * self.SWIR2
+        albedo = weighted_band_sum(
+            [
+                self.blue,
+                self.green,
+                self.red,
+                self.rededge1,
+                self.rededge2,
+                self.rededge3,
+                self.NIR_broad,
+                self.SWIR1,
+                self.SWIR2
+            ],
+            [0.1324, 0.1269, 0.1051, 0.0971, 0.0890, 0.0818, 0.0722, 0.0167, 0.0002]
+        )
 
         albedo.cmap = ALBEDO_CMAP
 
@@ -7,6 +7,9 @@ DEFAULT_PRODUCTS_DIRECTORY = "HLS_products"
 DEFAULT_TARGET_RESOLUTION = 30
 DEFAULT_PRODUCTS = ["NIR", "red"]
 
+# band numbers used by the HLS S30 and L30 products, formatted once at import
+BAND_NAMES = {band: f"B{band:02d}" for band in range(1, 16)}
+
 CONNECTION_CLOSE = {
     "Connection": "close",
 }
@@ -33,17 +36,31 @@ CMR_STAC_URL = "https://cmr.earthdata.nasa.gov/stac/LPCLOUD"
 WORKING_DIRECTORY = "."
 DOWNLOAD_DIRECTORY = "HLS2_download"
 PRODUCTS_DIRECTORY = "HLS2_products"
+LISTING_CACHE_DIRECTORY = "_listings"
+LISTING_CACHE_TTL_SECONDS = 6 * 60 * 60
+GIVEUP_DAYS = 10
+PROCESSED_BAND_CACHE_SIZE = 4
 TARGET_RESOLUTION = 30
 COLLECTIONS = ["HLSS30.v2.0", "HLSL30.v2.0"]
 DEFAULT_RETRIES = 3
 DEFAULT_WAIT_SECONDS = 20
 DEFAULT_DOWNLOAD_RETRIES = 3
 DEFAULT_DOWNLOAD_WAIT_SECONDS = 60
+DEFAULT_DOWNLOAD_THREADS = 16
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+DEFAULT_PROCESS_THREADS = 8
+RETRY_STATUS_CODES = [429, 500, 502, 503, 504]
+GDAL_READ_OPTIONS = {
+    "GDAL_CACHEMAX": 64,
+    "GDAL_NUM_THREADS": "ALL_CPUS",
+    "GDAL_DISABLE_READDIR_ON_OPEN": "EMPTY_DIR"
+}
 L30_CONCEPT = "C2021957657-LPCLOUD"
 S30_CONCEPT = "C2021957295-LPCLOUD"
 PAGE_SIZE = 2000
 CMR_SEARCH_URL = "https://cmr.earthdata.nasa.gov/search"
 CMR_GRANULES_JSON_URL = f"{CMR_SEARCH_URL}/granules.json"
+CMR_GRANULES_UMM_JSON_URL = f"{CMR_SEARCH_URL}/granules.umm_json"
 DEFAULT_HLS1_REMOTE = "https://hls.gsfc.nasa.gov/data/v1.4/"
 DEFAULT_HLS1_DOWNLOAD_DIRECTORY = "HLS1_download"
 DEFAULT_HLS1_PRODUCTS_DIRECTORY = "HLS1_products"
@@ -2,23 +2,32 @@ import datetime
 import logging
 from typing import List, Union
 
-from dateutil import parser
+from .parse_date import parse_date
 
 logger = logging.getLogger(__name__)
 
 
+# exact-type dispatch for the common inputs
+_DATE_COERCERS = {
+    str: parse_date,
+    datetime.date: lambda dt: dt,
+    datetime.datetime: datetime.datetime.date,
+    type(None): lambda dt: None,
+}
+
+
 def get_date(dt: Union[datetime.date, datetime.datetime, str]) -> datetime.date or None:
-    if dt is None:
-        return None
-    elif isinstance(dt, datetime.datetime):
-        return dt.date()
-    elif isinstance(dt, datetime.date):
-        return dt
-    elif isinstance(dt, str):
-        return parser.parse(dt).date()
-    else:
+    coerce = _DATE_COERCERS.get(type(dt))
+
+    if coerce is None:
+        # subclasses such as pandas Timestamp use their nearest base class in the table
+        coerce = next((_DATE_COERCERS[base] for base in type(dt).__mro__ if base in _DATE_COERCERS), None)
+
+    if coerce is None:
         raise ValueError(f"invalid date type: {type(dt)}")
 
+    return coerce(dt)
+
 
 def date_range(start: Union[datetime.date, str], end: Union[datetime.date, str]) -> List[datetime.date]:
     start = get_date(start)
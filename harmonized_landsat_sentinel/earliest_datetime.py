@@ -1,12 +1,11 @@
-from datetime import date, datetime
+from datetime import date, datetime, time, timezone
 from typing import Union
-from dateutil import parser
+from .parse_date import parse_date
 
 def earliest_datetime(date_in: Union[date, str]) -> datetime:
     if isinstance(date_in, str):
-        datetime_in = parser.parse(date_in)
-    else:
-        datetime_in = date_in
+        date_in = parse_date(date_in)
+    elif isinstance(date_in, datetime):
+        date_in = date_in.date()
 
-    date_string = datetime_in.strftime("%Y-%m-%d")
-    return parser.parse(f"{date_string}T00:00:00Z")
+    return datetime.combine(date_in, time(0, 0, 0), tzinfo=timezone.utc)
@@ -23,7 +23,13 @@ from .HLS2_granule import *
 from .HLS2_landsat_granule import *
 from .HLS2_sentinel_granule import *
 from .latest_datetime import *
+from .nanmean_pair import *
+from .normalized_difference import *
+from .parse_date import *
+from .repeat_pass_mask import *
 from .timer import *
+from .weighted_band_sum import *
+from .write_COG import *
 
 with open(join(abspath(dirname(__file__)), "version.txt")) as f:
     version = f.read()
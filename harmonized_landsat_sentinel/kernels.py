@@ -0,0 +1,91 @@
+"""
+Numba kernels for the per-pixel HLS raster operations.
+"""
+import threading
+from functools import wraps
+
+import numpy as np
+from numba import njit, prange
+
+# numba's workqueue threading layer aborts the interpreter when parallel kernels are entered from
+# several Python threads at once, and each call already spreads over every core, so calls are serialized
+KERNEL_LOCK = threading.Lock()
+
+
+def serialized(kernel):
+    @wraps(kernel)
+    def serialized_kernel(*args):
+        with KERNEL_LOCK:
+            return kernel(*args)
+
+    return serialized_kernel
+
+
+def initialize_threading_layer():
+    """
+    launch numba's threading layer from the calling thread before kernels are run from worker threads,
+    since a TBB scheduler first started on a short-lived worker thread hangs interpreter shutdown
+    """
+    fmask = np.zeros(1, dtype=np.uint8)
+    decode_fmask(fmask, np.empty(1, dtype=np.bool_), np.empty(1, dtype=np.bool_))
+
+
+@serialized
+@njit(parallel=True, cache=True)
+def decode_fmask(fmask: np.ndarray, cloud: np.ndarray, water: np.ndarray):
+    """
+    decode the cloud and water bits of a flattened Fmask array into boolean masks in a single pass
+    """
+    for i in prange(fmask.size):
+        value = fmask[i]
+        cloud[i] = (value & 15) > 0
+        water[i] = ((value >> 5) & 1) == 1
+
+
+@serialized
+@njit(parallel=True, cache=True)
+def scale_mask(DN: np.ndarray, fmask: np.ndarray, out: np.ndarray, apply_scale: bool, apply_cloud: bool):
+    """
+    scale flattened digital numbers to reflectance and mask fill, negative and cloudy pixels in a single pass
+    """
+    for i in prange(DN.size):
+        value = DN[i]
+
+        if apply_scale and (value == -1000 or value < 0):
+            out[i] = np.nan
+        elif apply_cloud and (fmask[i] & 15) > 0:
+            out[i] = np.nan
+        elif apply_scale:
+            out[i] = value * 0.0001
+        else:
+            out[i] = value
+
+
+@serialized
+@njit(parallel=True, cache=True)
+def normalized_ratio(a: np.ndarray, b: np.ndarray, out: np.ndarray):
+    """
+    compute the clipped normalized difference (a - b) / (a + b) of two flattened arrays in a single pass
+    """
+    for i in prange(a.size):
+        total = a[i] + b[i]
+
+        if total == 0:
+            out[i] = np.nan
+        else:
+            out[i] = min(max((a[i] - b[i]) / total, -1.0), 1.0)
+
+
+@serialized
+@njit(parallel=True, cache=True)
+def weighted_sum(arrays: tuple, weights: np.ndarray, offset: float, out: np.ndarray):
+    """
+    compute offset + sum(weights[k] * arrays[k]) over a tuple of flattened arrays in a single pass
+    """
+    for i in prange(out.size):
+        total = offset
+
+        for k in range(len(arrays)):
+            total += weights[k] * arrays[k][i]
+
+        out[i] = total
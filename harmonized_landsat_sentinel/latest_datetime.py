@@ -1,13 +1,12 @@
-from datetime import datetime, date
+from datetime import datetime, date, time, timezone
 from typing import Union
-from dateutil import parser
+from .parse_date import parse_date
 
 
 def latest_datetime(date_in: Union[date, str]) -> datetime:
     if isinstance(date_in, str):
-        datetime_in = parser.parse(date_in)
-    else:
-        datetime_in = date_in
+        date_in = parse_date(date_in)
+    elif isinstance(date_in, datetime):
+        date_in = date_in.date()
 
-    date_string = datetime_in.strftime("%Y-%m-%d")
-    return parser.parse(f"{date_string}T23:59:59Z")
+    return datetime.combine(date_in, time(23, 59, 59), tzinfo=timezone.utc)
@@ -0,0 +1,23 @@
+import numpy as np
+
+
+def nanmean_pair(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    NaN-aware mean of two equally shaped arrays computed into a single output buffer
+    without stacking the inputs into a temporary 3-D array.
+    """
+    a = np.asarray(a)
+    b = np.asarray(b)
+    a_valid = ~np.isnan(a)
+    b_valid = ~np.isnan(b)
+
+    out = np.zeros(a.shape, dtype=np.result_type(a, b))
+    np.copyto(out, a, where=a_valid)
+    np.add(out, b, out=out, where=b_valid)
+
+    count = a_valid.astype(np.uint8)
+    count += b_valid
+    np.divide(out, count, out=out, where=count > 0)
+    out[count == 0] = np.nan
+
+    return out
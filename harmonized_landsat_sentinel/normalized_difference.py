@@ -0,0 +1,16 @@
+import numpy as np
+from rasters import Raster
+
+from .kernels import normalized_ratio
+
+
+def normalized_difference(a: Raster, b: Raster) -> Raster:
+    """
+    clipped normalized difference (a - b) / (a + b) of two rasters as a single float32 raster
+    """
+    a_array = np.ascontiguousarray(a.array, dtype=np.float32)
+    b_array = np.ascontiguousarray(b.array, dtype=np.float32)
+    ratio = np.empty(a_array.shape, dtype=np.float32)
+    normalized_ratio(a_array.ravel(), b_array.ravel(), ratio.ravel())
+
+    return Raster(ratio, geometry=a.geometry, nodata=np.nan)
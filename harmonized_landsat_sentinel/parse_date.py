@@ -0,0 +1,18 @@
+from datetime import date
+from functools import lru_cache
+
+
+@lru_cache(maxsize=256)
+def parse_date(date_string: str) -> date:
+    """
+    parse a date string, taking the C-level ISO 8601 path for YYYY-MM-DD
+    and only falling back to dateutil's format inference for other layouts.
+    the same few date strings recur across listing, filename and download calls, so results are cached.
+    """
+    try:
+        return date.fromisoformat(date_string)
+    except ValueError:
+        # dateutil is only needed for non-ISO input
+        from dateutil import parser
+
+        return parser.parse(date_string).date()
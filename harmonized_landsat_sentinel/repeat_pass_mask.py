@@ -0,0 +1,15 @@
+import numpy as np
+
+
+def repeat_pass_mask(observed: np.ndarray, repeat_days: int) -> np.ndarray:
+    """
+    Propagate observed acquisitions forward along a contiguous daily axis, flagging every day that falls
+    a whole number of repeat cycles after an observed day.
+    """
+    expected = np.array(observed, dtype=bool)
+
+    # each residue class modulo the repeat cycle is an independent cumulative OR
+    for offset in range(min(repeat_days, len(expected))):
+        expected[offset::repeat_days] = np.logical_or.accumulate(expected[offset::repeat_days])
+
+    return expected
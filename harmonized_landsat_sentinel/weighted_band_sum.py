@@ -0,0 +1,17 @@
+from typing import List
+
+import numpy as np
+from rasters import Raster
+
+from .kernels import weighted_sum
+
+
+def weighted_band_sum(rasters: List[Raster], weights: List[float], offset: float = 0.0) -> Raster:
+    """
+    offset plus the weighted sum of equally shaped rasters, accumulated in one pass into a float32 raster
+    """
+    arrays = tuple(np.ascontiguousarray(raster.array, dtype=np.float32).ravel() for raster in rasters)
+    total = np.empty(rasters[0].shape, dtype=np.float32)
+    weighted_sum(arrays, np.array(weights, dtype=np.float64), offset, total.ravel())
+
+    return Raster(total, geometry=rasters[0].geometry, nodata=np.nan)
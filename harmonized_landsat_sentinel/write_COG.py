@@ -0,0 +1,37 @@
+import os
+from os.path import abspath, expanduser, exists, splitext
+
+import numpy as np
+import rasterio
+from rasters import Raster
+
+
+def write_COG(image: Raster, filename: str) -> str:
+    """
+    write a raster as a tiled, DEFLATE-compressed Cloud Optimized GeoTIFF with internal overviews
+    in one pass through the GDAL COG driver, replacing the target only once it is complete.
+    """
+    filename = abspath(expanduser(filename))
+    temporary_filename = f"{splitext(filename)[0]}.temp.tif"
+    # floating point predictor for reflectance and indices, horizontal differencing for integer layers
+    predictor = 3 if np.issubdtype(image.dtype, np.floating) else 2
+
+    try:
+        with rasterio.Env(GDAL_NUM_THREADS="ALL_CPUS"):
+            image.to_file(
+                temporary_filename,
+                driver="COG",
+                compress="DEFLATE",
+                PREDICTOR=predictor,
+                BLOCKSIZE=512,
+                BIGTIFF="IF_SAFER",
+                NUM_THREADS="ALL_CPUS"
+            )
+
+        os.replace(temporary_filename, filename)
+    finally:
+        # a failed write must not leave a partial file next to the product
+        if exists(temporary_filename):
+            os.remove(temporary_filename)
+
+    return filename
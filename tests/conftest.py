@@ -0,0 +1,21 @@
+import pytest
+import requests
+from affine import Affine
+from rasters import RasterGrid
+
+import harmonized_landsat_sentinel.HLS2_CMR_connection as HLS2_CMR_connection
+
+
+@pytest.fixture
+def connection(tmp_path, monkeypatch):
+    # an HLS2 connection that never logs in to Earthdata
+    monkeypatch.setattr(HLS2_CMR_connection, "HLS2_CMR_login", lambda: None)
+    monkeypatch.setattr(HLS2_CMR_connection.earthaccess, "get_requests_https_session", requests.Session)
+
+    return HLS2_CMR_connection.HLS2CMRConnection(working_directory=str(tmp_path))
+
+
+@pytest.fixture
+def geometry():
+    # a 2 x 3 grid of 30 m cells shared by the raster wrapper tests
+    return RasterGrid.from_affine(Affine(30, 0, 500000, 0, -30, 4000000), 2, 3, crs="EPSG:32611")
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+import rasterio
+from rasterio.transform import from_origin
+
+import harmonized_landsat_sentinel.HLS2_granule as HLS2_granule
+from harmonized_landsat_sentinel import HLS2SentinelGranule
+from harmonized_landsat_sentinel.constants import PROCESSED_BAND_CACHE_SIZE
+
+ID = "HLS.S30.T11SPS.2023001T183741.v2.0"
+BANDS = ["B02", "B03", "B04", "B05", "B06", "B07", "B08"]
+
+
+@pytest.fixture
+def granule(tmp_path):
+    rng = np.random.default_rng(0)
+    directory = tmp_path / ID
+    directory.mkdir()
+    profile = dict(driver="GTiff", width=16, height=16, count=1, crs="EPSG:32611",
+                   transform=from_origin(500000, 4000000, 30, 30))
+
+    for band in BANDS:
+        with rasterio.open(directory / f"{ID}.{band}.tif", "w", dtype="int16", **profile) as file:
+            file.write(rng.integers(0, 10000, (16, 16)).astype(np.int16), 1)
+
+    with rasterio.open(directory / f"{ID}.Fmask.tif", "w", dtype="uint8", **profile) as file:
+        file.write(rng.choice(np.array([0, 2, 32, 64], dtype=np.uint8), (16, 16)), 1)
+
+    return HLS2SentinelGranule(str(directory))
+
+
+@pytest.fixture
+def scale_mask_calls(monkeypatch):
+    calls = []
+    scale_mask = HLS2_granule.scale_mask
+
+    def counted_scale_mask(*args):
+        calls.append(args)
+        return scale_mask(*args)
+
+    monkeypatch.setattr(HLS2_granule, "scale_mask", counted_scale_mask)
+
+    return calls
+
+
+def test_band_memo_returns_independent_rasters(granule, scale_mask_calls):
+    first = granule.band("B04")
+    first.color("jet")
+    second = granule.band("B04")
+
+    assert len(scale_mask_calls) == 1
+    assert second is not first
+    assert second.cmap is None
+    assert second.array is first.array
+    assert second.geometry is first.geometry
+    assert granule.red.cmap is not None
+    assert granule.band("B04").cmap is None
+
+
+def test_band_memo_is_bounded(granule, scale_mask_calls):
+    for band in BANDS:
+        granule.band(band)
+
+    assert len(granule._processed) == PROCESSED_BAND_CACHE_SIZE
+
+    granule.band(BANDS[-1])
+    assert len(scale_mask_calls) == len(BANDS)
+
+    granule.band(BANDS[0])
+    assert len(scale_mask_calls) == len(BANDS) + 1
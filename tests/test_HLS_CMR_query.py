@@ -0,0 +1,83 @@
+import importlib
+from datetime import date
+
+import pytest
+
+from harmonized_landsat_sentinel.constants import L30_CONCEPT, S30_CONCEPT
+from harmonized_landsat_sentinel.exceptions import CMRServerUnreachable
+from harmonized_landsat_sentinel.HLS_CMR_query import HLS_CMR_query
+
+# the package re-exports the function under the module's name
+HLS_CMR_query_module = importlib.import_module("harmonized_landsat_sentinel.HLS_CMR_query")
+
+
+def item(sensor: str, day: int) -> dict:
+    return {
+        "meta": {"native-id": f"HLS.{sensor}.T11SPS.2023{day:03d}T183741.v2.0"},
+        "umm": {"TemporalExtent": {"RangeDateTime": {"BeginningDateTime": f"2023-01-{day:02d}T18:37:41.000Z"}}}
+    }
+
+
+class FakeResponse:
+    def __init__(self, items, search_after=None):
+        self.items = items
+        self.headers = {} if search_after is None else {"CMR-Search-After": search_after}
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return {"items": self.items}
+
+
+class FakeSession:
+    # Sentinel granules come back over two pages, Landsat granules over one
+    PAGES = {
+        (S30_CONCEPT, None): ([item("S30", 5), item("S30", 1)], "page-2"),
+        (S30_CONCEPT, "page-2"): ([item("S30", 10)], None),
+        (L30_CONCEPT, None): ([item("L30", 3)], None),
+    }
+
+    def __init__(self):
+        self.requests = []
+        self.closed = False
+
+    def get(self, URL, params=None, headers=None):
+        key = (params["collection_concept_id"], headers.get("CMR-Search-After"))
+        self.requests.append(key)
+
+        return FakeResponse(*self.PAGES[key])
+
+    def close(self):
+        self.closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def test_HLS_CMR_query_pages(monkeypatch):
+    session = FakeSession()
+    monkeypatch.setattr(HLS_CMR_query_module.requests, "Session", lambda: session)
+    granules = HLS_CMR_query("11SPS", date(2023, 1, 1), date(2023, 1, 10), page_size=2)
+
+    assert sorted(session.requests, key=str) == sorted(FakeSession.PAGES, key=str)
+    assert list(granules.date_UTC) == ["2023-01-01", "2023-01-03", "2023-01-05", "2023-01-10"]
+    assert list(granules.sensor) == ["S30", "L30", "S30", "S30"]
+    assert set(granules.tile) == {"11SPS"}
+    assert session.closed
+
+
+def test_HLS_CMR_query_unreachable():
+    class FailingSession(FakeSession):
+        def get(self, URL, params=None, headers=None):
+            raise ConnectionError("CMR is down")
+
+    session = FailingSession()
+
+    with pytest.raises(CMRServerUnreachable):
+        HLS_CMR_query("11SPS", date(2023, 1, 1), date(2023, 1, 10), session=session)
+
+    assert not session.closed
@@ -0,0 +1,29 @@
+import datetime
+
+import pandas as pd
+import pytest
+
+from harmonized_landsat_sentinel.daterange import date_range, get_date
+
+def test_get_date():
+    assert get_date("2023-01-02") == datetime.date(2023, 1, 2)
+    assert get_date(datetime.date(2023, 1, 2)) == datetime.date(2023, 1, 2)
+    assert get_date(datetime.datetime(2023, 1, 2, 18, 37)) == datetime.date(2023, 1, 2)
+    assert get_date(None) is None
+
+def test_get_date_subclasses():
+    timestamp = get_date(pd.Timestamp("2023-01-02T18:37:41"))
+
+    assert type(timestamp) is datetime.date
+    assert timestamp == datetime.date(2023, 1, 2)
+
+def test_get_date_invalid_type():
+    with pytest.raises(ValueError):
+        get_date(20230102)
+
+def test_date_range():
+    assert date_range("2023-01-30", datetime.date(2023, 2, 1)) == [
+        datetime.date(2023, 1, 30),
+        datetime.date(2023, 1, 31),
+        datetime.date(2023, 2, 1)
+    ]
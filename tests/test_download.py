@@ -0,0 +1,112 @@
+from datetime import date
+
+import pytest
+
+from harmonized_landsat_sentinel.exceptions import (
+    HLSDownloadFailed,
+    HLSLandsatNotAvailable,
+    HLSSentinelMissing
+)
+
+URL = "https://data.lpdaac.earthdatacloud.nasa.gov/lp-prod-protected/HLSS30.020"
+ID = "HLS.S30.T11SPS.2023001T183741.v2.0"
+
+
+class FakeGranule:
+    def __init__(self, bands):
+        self.bands = bands
+
+    def data_links(self):
+        return [f"{URL}/{ID}/{ID}.{band}.tif" for band in self.bands]
+
+
+class FakeResponse:
+    def __init__(self, chunks, fail_after=None):
+        self.chunks = chunks
+        self.fail_after = fail_after
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size=None):
+        for index, chunk in enumerate(self.chunks):
+            if index == self.fail_after:
+                raise ConnectionError("connection reset")
+
+            yield chunk
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+
+class FakeSession:
+    def __init__(self, fail_after=None):
+        self.fail_after = fail_after
+        self.URLs = []
+
+    def get(self, URL, stream=False):
+        self.URLs.append(URL)
+
+        return FakeResponse([b"HLS", b"data"], fail_after=self.fail_after)
+
+
+def test_download_granule_skips_downloaded_files(connection, tmp_path):
+    directory = tmp_path / ID
+    directory.mkdir()
+    (directory / f"{ID}.B04.tif").write_bytes(b"cached")
+    connection._session = FakeSession()
+
+    filenames = connection.download_granule(FakeGranule(["B04", "B08", "Fmask"]), str(directory))
+
+    assert [filename.split("/")[-1] for filename in filenames] == [f"{ID}.B04.tif", f"{ID}.B08.tif", f"{ID}.Fmask.tif"]
+    assert sorted(URL.split(".")[-2] for URL in connection._session.URLs) == ["B08", "Fmask"]
+    assert (directory / f"{ID}.B04.tif").read_bytes() == b"cached"
+    assert (directory / f"{ID}.B08.tif").read_bytes() == b"HLSdata"
+    assert not list(directory.glob("*.download"))
+
+
+def test_download_granule_removes_partial_files(connection, tmp_path):
+    directory = tmp_path / ID
+    connection._session = FakeSession(fail_after=1)
+
+    with pytest.raises(HLSDownloadFailed):
+        connection.download_granule(FakeGranule(["B04", "B08"]), str(directory))
+
+    assert list(directory.iterdir()) == []
+
+
+def test_sentinel_and_landsat_skips_unavailable_sensor(connection, monkeypatch):
+    fetched = []
+
+    def landsat_granule(tile, date_UTC):
+        raise HLSLandsatNotAvailable(f"Landsat is not available at tile {tile} on {date_UTC}")
+
+    monkeypatch.setattr(connection, "listing", lambda tile, start_UTC, end_UTC: None)
+    monkeypatch.setattr(connection, "sentinel_granule", lambda tile, date_UTC: FakeGranule(["B04"]))
+    monkeypatch.setattr(connection, "landsat_granule", landsat_granule)
+    monkeypatch.setattr(connection, "sentinel", lambda tile, date_UTC: fetched.append("sentinel") or "sentinel")
+    monkeypatch.setattr(connection, "landsat", lambda tile, date_UTC: fetched.append("landsat") or "landsat")
+
+    assert connection.sentinel_and_landsat("11SPS", date(2023, 1, 1)) == ("sentinel", None)
+    assert fetched == ["sentinel"]
+
+
+def test_sentinel_and_landsat_missing_downloads_nothing(connection, monkeypatch):
+    fetched = []
+
+    def sentinel_granule(tile, date_UTC):
+        raise HLSSentinelMissing(f"Sentinel is missing on remote server at tile {tile} on {date_UTC}")
+
+    monkeypatch.setattr(connection, "listing", lambda tile, start_UTC, end_UTC: None)
+    monkeypatch.setattr(connection, "sentinel_granule", sentinel_granule)
+    monkeypatch.setattr(connection, "landsat_granule", lambda tile, date_UTC: FakeGranule(["B04"]))
+    monkeypatch.setattr(connection, "sentinel", lambda tile, date_UTC: fetched.append("sentinel"))
+    monkeypatch.setattr(connection, "landsat", lambda tile, date_UTC: fetched.append("landsat"))
+
+    with pytest.raises(HLSSentinelMissing):
+        connection.sentinel_and_landsat("11SPS", date(2023, 1, 1))
+
+    assert fetched == []
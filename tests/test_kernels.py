@@ -0,0 +1,39 @@
+import numpy as np
+
+from harmonized_landsat_sentinel.kernels import decode_fmask, scale_mask, normalized_ratio, weighted_sum
+
+def test_decode_fmask():
+    fmask = np.array([0, 1, 8, 16, 32, 34, 64, 255], dtype=np.uint8)
+    cloud = np.empty(fmask.shape, dtype=np.bool_)
+    water = np.empty(fmask.shape, dtype=np.bool_)
+    decode_fmask(fmask, cloud, water)
+
+    np.testing.assert_array_equal(cloud, (fmask & 15) > 0)
+    np.testing.assert_array_equal(water, ((fmask >> 5) & 1) == 1)
+
+def test_scale_mask():
+    DN = np.array([-1000, -5, 0, 2500, 10000, 1234], dtype=np.int16)
+    fmask = np.array([0, 0, 0, 2, 0, 64], dtype=np.uint8)
+    out = np.empty(DN.shape, dtype=np.float32)
+    scale_mask(DN, fmask, out, True, True)
+
+    expected = np.array([np.nan, np.nan, 0.0, np.nan, 1.0, 0.1234], dtype=np.float32)
+    np.testing.assert_allclose(out, expected, equal_nan=True)
+
+def test_normalized_ratio():
+    a = np.array([0.5, 0.0, 0.2, np.nan, 0.3], dtype=np.float32)
+    b = np.array([0.1, 0.0, 0.6, 0.1, 0.0], dtype=np.float32)
+    out = np.empty(a.shape, dtype=np.float32)
+    normalized_ratio(a, b, out)
+
+    expected = np.array([2 / 3, np.nan, -0.5, np.nan, 1.0], dtype=np.float32)
+    np.testing.assert_allclose(out, expected, rtol=1e-6, equal_nan=True)
+
+def test_weighted_sum():
+    a = np.array([0.1, 0.2, np.nan], dtype=np.float32)
+    b = np.array([0.3, 0.0, 0.5], dtype=np.float32)
+    weights = np.array([0.5, 0.25])
+    out = np.empty(a.shape, dtype=np.float32)
+    weighted_sum((a, b), weights, -0.01, out)
+
+    np.testing.assert_allclose(out, 0.5 * a + 0.25 * b - 0.01, rtol=1e-6, equal_nan=True)
@@ -0,0 +1,65 @@
+import json
+from datetime import date, datetime, timedelta
+from time import time as unix_time
+
+import pandas as pd
+from earthaccess.search import DataGranule
+
+from harmonized_landsat_sentinel.constants import GIVEUP_DAYS, LISTING_CACHE_TTL_SECONDS
+
+
+def granule(ID: str) -> DataGranule:
+    return DataGranule({"umm": {}, "meta": {"native-id": ID}}, cloud_hosted=True)
+
+
+def listing(dates, sentinel, landsat) -> pd.DataFrame:
+    return pd.DataFrame({
+        "date_UTC": [date_UTC.isoformat() for date_UTC in dates],
+        "tile": "11SPS",
+        "sentinel": sentinel,
+        "landsat": landsat
+    })
+
+
+def test_cached_listing_rows_expire(connection):
+    dates = [date(2023, 1, 1), date(2023, 1, 2)]
+    connection.save_cached_listing("11SPS", listing(dates, [granule("S1"), float("nan")], [float("nan")] * 2))
+    filename = connection.cached_listing_filename("11SPS")
+
+    with open(filename) as file:
+        rows = json.load(file)
+
+    # the first row was listed before the TTL, re-saving must not refresh it
+    rows[0]["listed_at"] = unix_time() - LISTING_CACHE_TTL_SECONDS - 4 * 60 * 60
+
+    with open(filename, "w") as file:
+        json.dump(rows, file)
+
+    cached_listing = connection.load_cached_listing("11SPS")
+    assert list(cached_listing.date_UTC) == ["2023-01-02"]
+
+    connection.save_cached_listing("11SPS", listing([date(2023, 1, 3)], [float("nan")], [float("nan")]), cached_listing)
+    cached_listing = connection.load_cached_listing("11SPS")
+    assert list(cached_listing.date_UTC) == ["2023-01-02", "2023-01-03"]
+    assert cached_listing.sentinel.isna().all()
+
+
+def test_cached_listing_round_trips_granules(connection):
+    connection.save_cached_listing("11SPS", listing([date(2023, 1, 1)], [granule("S1")], ["missing"]))
+    cached_listing = connection.load_cached_listing("11SPS")
+
+    assert isinstance(cached_listing.sentinel[0], DataGranule)
+    assert cached_listing.sentinel[0]["meta"]["native-id"] == "S1"
+    assert cached_listing.landsat[0] == "missing"
+
+
+def test_recent_unsettled_rows_not_cached(connection):
+    today = datetime.utcnow().date()
+    dates = [today - timedelta(days=GIVEUP_DAYS + 1), today - timedelta(days=1), today]
+    connection.save_cached_listing(
+        "11SPS",
+        listing(dates, [float("nan"), granule("S1"), granule("S2")], [float("nan"), "missing", granule("L1")])
+    )
+
+    cached_listing = connection.load_cached_listing("11SPS")
+    assert list(cached_listing.date_UTC) == [dates[0].isoformat(), dates[2].isoformat()]
@@ -0,0 +1,20 @@
+import numpy as np
+
+from harmonized_landsat_sentinel import nanmean_pair
+
+def test_nanmean_pair():
+    a = np.array([[1.0, np.nan], [np.nan, 4.0]], dtype=np.float32)
+    b = np.array([[3.0, 2.0], [np.nan, np.nan]], dtype=np.float32)
+    result = nanmean_pair(a, b)
+
+    assert result.dtype == np.float32
+    np.testing.assert_array_equal(result, np.array([[2.0, 2.0], [np.nan, 4.0]], dtype=np.float32))
+
+def test_nanmean_pair_promotes_dtype():
+    a = np.array([[1.0, np.nan]], dtype=np.float32)
+    b = np.array([[2.0, 4.0]], dtype=np.float64)
+    result = nanmean_pair(a, b)
+
+    assert result.dtype == np.float64
+    assert result.shape == a.shape
+    np.testing.assert_array_equal(result, [[1.5, 4.0]])
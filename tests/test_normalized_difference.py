@@ -0,0 +1,23 @@
+import numpy as np
+from rasters import Raster
+
+from harmonized_landsat_sentinel import normalized_difference
+
+def test_normalized_difference_raster(geometry):
+    a = Raster(np.full((2, 3), 0.5, dtype=np.float64), geometry=geometry)
+    b = Raster(np.full((2, 3), 0.1, dtype=np.float64), geometry=geometry)
+    result = normalized_difference(a, b)
+
+    assert isinstance(result, Raster)
+    assert result.geometry is a.geometry
+    assert result.shape == (2, 3)
+    assert result.array.dtype == np.float32
+    assert np.isnan(result.nodata)
+
+def test_normalized_difference_integer_bands(geometry):
+    a = Raster(np.array([[5, 0, 3], [1, 2, 0]], dtype=np.int16), geometry=geometry)
+    b = Raster(np.array([[1, 0, 3], [1, 0, 2]], dtype=np.int16), geometry=geometry)
+    result = normalized_difference(a, b)
+
+    assert result.array.dtype == np.float32
+    np.testing.assert_allclose(result.array, [[2 / 3, np.nan, 0.0], [0.0, 1.0, -1.0]], rtol=1e-6, equal_nan=True)
@@ -0,0 +1,10 @@
+from datetime import date
+
+from harmonized_landsat_sentinel import parse_date
+
+def test_parse_date_iso():
+    assert parse_date("2024-02-29") == date(2024, 2, 29)
+
+def test_parse_date_fallback():
+    assert parse_date("2024-02-29 12:30:00") == date(2024, 2, 29)
+    assert parse_date("Feb 29 2024") == date(2024, 2, 29)
@@ -0,0 +1,87 @@
+import subprocess
+import sys
+import textwrap
+import threading
+from datetime import date
+
+from harmonized_landsat_sentinel.HLS_connection import HLSConnection
+
+PROCESS_SCRIPT = textwrap.dedent("""
+    import json
+    import sys
+    from datetime import date
+
+    import numpy as np
+    from rasters import Raster
+
+    from harmonized_landsat_sentinel.HLS_connection import HLSConnection
+    from harmonized_landsat_sentinel.exceptions import HLSLandsatNotAvailable, HLSSentinelMissing
+    from harmonized_landsat_sentinel.normalized_difference import normalized_difference
+
+
+    class FakeGranule:
+        def __init__(self, geometry):
+            self.geometry = geometry
+
+        def product(self, product):
+            rng = np.random.default_rng(0)
+            NIR = Raster(rng.random(self.geometry.shape, dtype=np.float32), geometry=self.geometry, nodata=np.nan)
+            red = Raster(rng.random(self.geometry.shape, dtype=np.float32), geometry=self.geometry, nodata=np.nan)
+
+            return normalized_difference(NIR, red)
+
+
+    class FakeConnection(HLSConnection):
+        def listing(self, tile, start_UTC, end_UTC=None):
+            pass
+
+        def sentinel(self, tile, date_UTC):
+            if date_UTC == date(2024, 1, 3):
+                raise HLSSentinelMissing(f"Sentinel is missing at tile {tile} on {date_UTC}")
+
+            return FakeGranule(self.grid(tile))
+
+        def landsat(self, tile, date_UTC):
+            raise HLSLandsatNotAvailable(f"Landsat is not available at tile {tile} on {date_UTC}")
+
+
+    connection = FakeConnection(working_directory=sys.argv[1], target_resolution=30)
+    filenames = connection.process("2024-01-01", "2024-01-03", target="11SPS", product_names=["NDVI"], threads=3)
+    print(json.dumps({f"{date_UTC}/{product}": filename for (date_UTC, product), filename in filenames.items()}))
+""")
+
+
+def test_process_exits(tmp_path):
+    # numba kernels run from the process() workers must not keep the interpreter alive at shutdown
+    result = subprocess.run(
+        [sys.executable, "-c", PROCESS_SCRIPT, str(tmp_path)],
+        capture_output=True,
+        text=True,
+        timeout=300
+    )
+
+    assert result.returncode == 0, result.stderr
+    filenames = result.stdout.strip().splitlines()[-1]
+
+    assert "2024-01-01/NDVI" in filenames
+    assert "2024-01-02/NDVI" in filenames
+    assert "2024-01-03/NDVI" not in filenames
+    assert len(list(tmp_path.rglob("HLS_11SPS_*_NDVI.tif"))) == 2
+
+
+def test_mark_date_unavailable_threads(tmp_path):
+    connection = HLSConnection(working_directory=str(tmp_path))
+    dates = [date(2024, 1, day) for day in range(1, 29)]
+    threads = [
+        threading.Thread(target=connection.mark_date_unavailable, args=("Sentinel", "11SPS", date_UTC))
+        for date_UTC
+        in dates
+    ]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert all(connection.check_unavailable_date("Sentinel", "11SPS", date_UTC) for date_UTC in dates)
@@ -0,0 +1,12 @@
+import numpy as np
+
+from harmonized_landsat_sentinel import repeat_pass_mask
+
+def test_repeat_pass_mask():
+    observed = np.array([False, True, False, False, False, False, False, True, False, False])
+    expected = repeat_pass_mask(observed, 3)
+
+    np.testing.assert_array_equal(
+        expected,
+        np.array([False, True, False, False, True, False, False, True, False, False])
+    )
@@ -0,0 +1,23 @@
+import numpy as np
+from rasters import Raster
+
+from harmonized_landsat_sentinel import weighted_band_sum
+
+def test_weighted_band_sum_raster(geometry):
+    a = Raster(np.full((2, 3), 0.2, dtype=np.float64), geometry=geometry)
+    b = Raster(np.full((2, 3), 0.4, dtype=np.float64), geometry=geometry)
+    result = weighted_band_sum([a, b], [0.5, 0.25], offset=-0.01)
+
+    assert isinstance(result, Raster)
+    assert result.geometry is a.geometry
+    assert result.shape == (2, 3)
+    assert result.array.dtype == np.float32
+    assert np.isnan(result.nodata)
+    np.testing.assert_allclose(result.array, 0.19, rtol=1e-6)
+
+def test_weighted_band_sum_propagates_nan(geometry):
+    a = Raster(np.array([[0.1, np.nan, 0.3], [0.4, 0.5, 0.6]], dtype=np.float32), geometry=geometry)
+    result = weighted_band_sum([a], [1.0])
+
+    assert np.isnan(result.array[0, 1])
+    assert np.count_nonzero(np.isnan(result.array)) == 1